@@ -1,16 +1,86 @@
+import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from operator import itemgetter
+from typing import (Any, Awaitable, Callable, Dict, Iterator, List, Optional)
 
 from azure.ai.projects import AIProjectClient
+from azure.ai.projects.aio import AIProjectClient as AsyncAIProjectClient
 from azure.ai.projects.models import MessageRole, MessageTextContent
 from azure.core.exceptions import HttpResponseError
 from azure.identity import DefaultAzureCredential
+from azure.identity.aio import \
+    DefaultAzureCredential as AsyncDefaultAzureCredential
+from cachetools import TTLCache
 from tabulate import tabulate
+from tenacity import (Retrying, retry_if_exception, stop_after_attempt,
+                      wait_random_exponential)
 
+from src.agenticai.config import get_config
 from utils.ml_logging import get_logger
 
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+_BACKOFF_WAIT = wait_random_exponential(multiplier=0.5, max=8)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Return True for transient Foundry HTTP failures worth retrying."""
+    return (
+        isinstance(exc, HttpResponseError)
+        and exc.status_code in _RETRYABLE_STATUS_CODES
+    )
+
+
+def _retry_wait(retry_state) -> float:
+    """Honor the service's Retry-After header when present, else back off with jitter."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, HttpResponseError) and exc.response is not None:
+        retry_after = exc.response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return _BACKOFF_WAIT(retry_state)
+
+# Hoisted field extraction for agent table rows: one itemgetter call per row
+# instead of five dict.get lookups.
+_AGENT_ROW_DEFAULTS = {"id": "N/A", "name": "N/A", "model": "N/A", "created_at": "N/A"}
+_AGENT_ROW_GETTER = itemgetter("id", "name", "model", "created_at")
+
+# Module-level singletons so every AzureAIAgents instance shares one credential
+# (token acquisition is expensive) and one AIProjectClient per connection
+# string (reusing the underlying HTTP connection pool).
+_CLIENT_LOCK = threading.Lock()
+_CLIENT_CACHE: Dict[str, AIProjectClient] = {}
+_CRED_SINGLETON: Optional[DefaultAzureCredential] = None
+
+
+def _get_default_credential() -> DefaultAzureCredential:
+    """Return the shared DefaultAzureCredential, creating it on first use."""
+    global _CRED_SINGLETON
+    with _CLIENT_LOCK:
+        if _CRED_SINGLETON is None:
+            _CRED_SINGLETON = DefaultAzureCredential()
+        return _CRED_SINGLETON
+
+
+def _get_project_client(
+    connection_string: str, credential: DefaultAzureCredential
+) -> AIProjectClient:
+    """Return a cached AIProjectClient for the connection string, creating it if needed."""
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(connection_string)
+        if client is None:
+            client = AIProjectClient.from_connection_string(
+                conn_str=connection_string, credential=credential
+            )
+            _CLIENT_CACHE[connection_string] = client
+        return client
+
 
 class AzureAIAgents:
     """
@@ -36,7 +106,7 @@ class AzureAIAgents:
         self.logger = get_logger("AzureAIAgents")
 
         if not connection_string:
-            connection_string = os.getenv("AZURE_AI_FOUNDRY_CONNECTION_STRING")
+            connection_string = get_config().foundry_connection_string
 
         if not connection_string:
             raise ValueError(
@@ -44,38 +114,82 @@ class AzureAIAgents:
             )
 
         if credential is None:
-            credential = DefaultAzureCredential()
+            credential = _get_default_credential()
+
+        # Reuse the shared AIProjectClient for this connection string.
+        self.project = _get_project_client(connection_string, credential)
+
+        self._connection_string = connection_string
+        self._async_project: Optional[AsyncAIProjectClient] = None
+        # Pre-warmed conversation threads so the next query skips create_thread latency.
+        self._prewarmed_threads: List[Any] = []
+        # Strong references to in-flight background tasks: the event loop only
+        # keeps a weak reference, so an unreferenced task can be collected
+        # before it runs.
+        self._background_tasks: set = set()
+
+        # Short-lived caches so repeated lookups on the agent hot path do not
+        # pay a fresh HTTP round-trip to Foundry for every call.
+        self._cache_lock = threading.RLock()
+        self._agent_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+        self._list_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+        self.logger.info("AI Foundry project client created successfully.")
 
-        # Create the AIProjectClient
-        self.project = AIProjectClient.from_connection_string(
-            conn_str=connection_string, credential=credential
+    def _call_with_retry(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        Invoke a Foundry SDK call, retrying transient 408/429/5xx failures with
+        jittered exponential backoff (up to 4 attempts).
+
+        :param func: The SDK callable to invoke.
+        :param args: Positional arguments forwarded to the callable.
+        :param kwargs: Keyword arguments forwarded to the callable.
+        :return: Whatever the callable returns.
+        """
+        retryer = Retrying(
+            retry=retry_if_exception(_is_retryable),
+            wait=_retry_wait,
+            stop=stop_after_attempt(4),
+            reraise=True,
         )
+        return retryer(func, *args, **kwargs)
 
-        self.logger.info("AI Foundry project client created successfully.")
+    def iter_agents(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields registered agent dictionaries from Azure AI Foundry one at a time.
+
+        Programmatic callers should use this directly and skip the table
+        rendering cost of list_agents entirely.
+
+        :return: An iterator of raw agent dictionaries.
+        """
+        self.logger.debug("Retrieving agent list...")
+        with self._cache_lock:
+            agents_response = self._list_cache.get("agents")
+            if agents_response is None:
+                agents_response = self._call_with_retry(
+                    self.project.agents.list_agents
+                )
+                self._list_cache["agents"] = agents_response
+
+        yield from agents_response.get("data", [])
 
     def list_agents(self) -> None:
         """
         Retrieves and displays all registered agents from Azure AI Foundry
         in a formatted table (ID, Name, Model, Created At, Owner).
         """
-        self.logger.debug("Retrieving agent list...")
-        agents_response = self.project.agents.list_agents()
-
-        # Prepare table headers.
         table_headers = ["ID", "Name", "Model", "Created At", "Owner"]
-        table_rows = []
-
-        for agent_data in agents_response.get("data", []):
-            agent_id = agent_data.get("id", "N/A")
-            name = agent_data.get("name", "N/A")
-            model = agent_data.get("model", "N/A")
-            created_at = agent_data.get("created_at", "N/A")
-            owner = agent_data.get("metadata", {}).get("owner", "N/A")
-
-            table_rows.append([agent_id, name, model, created_at, owner])
+        table_rows = (
+            (
+                *_AGENT_ROW_GETTER({**_AGENT_ROW_DEFAULTS, **agent_data}),
+                agent_data.get("metadata", {}).get("owner", "N/A"),
+            )
+            for agent_data in self.iter_agents()
+        )
 
-        # Print the table using tabulate.
-        print(tabulate(table_rows, headers=table_headers, tablefmt="grid"))
+        # "simple" is a noticeably faster tabulate formatter than "grid".
+        print(tabulate(table_rows, headers=table_headers, tablefmt="simple"))
         self.logger.info("Agent list retrieval complete.")
 
     def get_agent(self, assistant_id: str) -> Dict[str, Any]:
@@ -85,8 +199,18 @@ class AzureAIAgents:
         :param assistant_id: The unique ID for the agent.
         :return: Dictionary containing agent info if found.
         """
+        with self._cache_lock:
+            cached = self._agent_cache.get(assistant_id)
+        if cached is not None:
+            self.logger.debug(f"Agent cache hit: {assistant_id}")
+            return cached
+
         try:
-            agent_info = self.project.agents.get_agent(assistant_id=assistant_id)
+            agent_info = self._call_with_retry(
+                self.project.agents.get_agent, assistant_id=assistant_id
+            )
+            with self._cache_lock:
+                self._agent_cache[assistant_id] = agent_info
             self.logger.info(f"Retrieved Agent: {assistant_id}")
             return agent_info
         except HttpResponseError as e:
@@ -128,7 +252,7 @@ class AzureAIAgents:
         :return: Dictionary representing the created agent.
         """
         if not deployment_name:
-            deployment_name = os.environ.get("AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID")
+            deployment_name = get_config().chat_deployment_id
             if not deployment_name:
                 self.logger.error(
                     "Environment variable 'AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID' is not set."
@@ -141,7 +265,8 @@ class AzureAIAgents:
             metadata = {"owner": "IT Support"}
 
         try:
-            created_agent = self.project.agents.create_agent(
+            created_agent = self._call_with_retry(
+                self.project.agents.create_agent,
                 model=deployment_name,
                 name=name,
                 description=description,
@@ -156,6 +281,8 @@ class AzureAIAgents:
                 content_type=content_type,
                 **kwargs,
             )
+            with self._cache_lock:
+                self._list_cache.clear()
             self.logger.info(f"Created Agent ID: {created_agent.id}")
             self.logger.info(f"Agent Metadata: {created_agent.metadata}")
             return created_agent
@@ -184,19 +311,177 @@ class AzureAIAgents:
             )
 
         try:
-            thread = self.project.agents.create_thread()
+            thread = self._call_with_retry(self.project.agents.create_thread)
+            self.logger.info(f"[Agent {agent_id}] Created Thread: {thread.id}")
+
+            user_msg = self._call_with_retry(
+                self.project.agents.create_message,
+                thread_id=thread.id,
+                role=MessageRole.USER,
+                content=query,
+            )
+            self.logger.info(
+                f"[Agent {agent_id}] Created user message ID: {user_msg.id}"
+            )
+
+            run = self._call_with_retry(
+                self.project.agents.create_and_process_run,
+                thread_id=thread.id,
+                assistant_id=agent_id,
+            )
+            self.logger.info(
+                f"[Agent {agent_id}] Run finished with status: {run.status}"
+            )
+
+            if run.status == "failed":
+                self.logger.error(f"[Agent {agent_id}] Run failed.")
+
+            # Foundry returns messages newest-first; only the top few are
+            # needed to find the assistant's reply, so don't fetch the thread.
+            all_messages = self._call_with_retry(
+                self.project.agents.list_messages,
+                thread_id=thread.id,
+                limit=5,
+                order="desc",
+            )
+            self.logger.info(f"----- Conversation for Agent {agent_id} -----")
+
+            final_text = "No response from agent."
+            for msg in all_messages.data:
+                if msg.content and len(msg.content):
+                    last_content = msg.content[-1]
+                    if isinstance(last_content, MessageTextContent):
+                        content_text = last_content.text.value
+                        self.logger.info(f"{msg.role.upper()}: {content_text}")
+                        if msg.role == MessageRole.ASSISTANT:
+                            final_text = content_text
+                            break
+
+            return final_text
+
+        except Exception as e:
+            self.logger.error("Failed to create and process run", exc_info=True)
+            raise e
+
+    def _get_async_project(self) -> AsyncAIProjectClient:
+        """
+        Lazily create (and then reuse) the async AIProjectClient counterpart.
+
+        :return: The shared async project client for this connection string.
+        """
+        if self._async_project is None:
+            self._async_project = AsyncAIProjectClient.from_connection_string(
+                conn_str=self._connection_string,
+                credential=AsyncDefaultAzureCredential(),
+            )
+        return self._async_project
+
+    async def _prewarm_thread(self) -> None:
+        """Create a spare conversation thread in the background for the next query."""
+        try:
+            if len(self._prewarmed_threads) < 2:
+                project = self._get_async_project()
+                self._prewarmed_threads.append(await project.agents.create_thread())
+        except Exception:
+            self.logger.debug(
+                "Thread pre-warm failed; will create on demand.", exc_info=True
+            )
+
+    async def _acquire_thread(self) -> Any:
+        """
+        Return a pre-warmed conversation thread if one is available, otherwise
+        create one now. A background task refills the pool either way.
+        """
+        project = self._get_async_project()
+        if self._prewarmed_threads:
+            thread = self._prewarmed_threads.pop()
+        else:
+            thread = await project.agents.create_thread()
+        task = asyncio.create_task(self._prewarm_thread())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return thread
+
+    async def run_agent_conversation_async(
+        self,
+        agent: Dict[str, Any],
+        query: str,
+        timeout: float = 30.0,
+        poll_interval: float = 0.1,
+        tool_dispatcher: Optional[Callable[[Any], Awaitable[Any]]] = None,
+    ) -> str:
+        """
+        Async counterpart of run_agent_conversation. Uses the aio Foundry client,
+        replaces the blocking create_and_process_run with an adaptive asyncio
+        polling loop (starting at `poll_interval`, backing off to a 2s cap),
+        and pre-warms the next conversation thread in the background.
+
+        :param agent: Dictionary containing the agent info (including the agent.id).
+        :param query: The user query to send to the agent.
+        :param timeout: Failsafe ceiling (seconds) on run polling.
+        :param poll_interval: Initial seconds to sleep between run status checks.
+        :param tool_dispatcher: Async callable invoked per required tool call when
+            the run needs action; its results are submitted as tool outputs.
+            Without one, a run requiring action is cancelled instead of hanging.
+        :return: The final text response from the agent.
+        """
+        agent_id = agent.get("id")
+        if not agent_id:
+            raise ValueError(
+                "Agent object missing 'id' field. Cannot run conversation."
+            )
+
+        try:
+            project = self._get_async_project()
+
+            thread = await self._acquire_thread()
             self.logger.info(f"[Agent {agent_id}] Created Thread: {thread.id}")
 
-            user_msg = self.project.agents.create_message(
+            user_msg = await project.agents.create_message(
                 thread_id=thread.id, role=MessageRole.USER, content=query
             )
             self.logger.info(
                 f"[Agent {agent_id}] Created user message ID: {user_msg.id}"
             )
 
-            run = self.project.agents.create_and_process_run(
+            run = await project.agents.create_run(
                 thread_id=thread.id, assistant_id=agent_id
             )
+            delay = poll_interval
+            deadline = time.monotonic() + timeout
+            while run.status in ("queued", "in_progress", "requires_action"):
+                if run.status == "requires_action":
+                    tool_calls = run.required_action.submit_tool_outputs.tool_calls
+                    if tool_dispatcher is None:
+                        self.logger.error(
+                            f"[Agent {agent_id}] Run requires tool action but no "
+                            "tool_dispatcher was provided; cancelling run."
+                        )
+                        await project.agents.cancel_run(
+                            thread_id=thread.id, run_id=run.id
+                        )
+                        break
+                    outputs = await asyncio.gather(
+                        *(tool_dispatcher(tc) for tc in tool_calls)
+                    )
+                    run = await project.agents.submit_tool_outputs_to_run(
+                        thread_id=thread.id,
+                        run_id=run.id,
+                        tool_outputs=list(outputs),
+                    )
+                    continue
+                if time.monotonic() >= deadline:
+                    self.logger.error(
+                        f"[Agent {agent_id}] Run polling timed out after {timeout}s."
+                    )
+                    break
+                await asyncio.sleep(delay)
+                # Fast runs finish within the first short sleeps; slow ones
+                # back off exponentially toward the 2s cap.
+                delay = min(delay * 1.5, 2.0)
+                run = await project.agents.get_run(
+                    thread_id=thread.id, run_id=run.id
+                )
             self.logger.info(
                 f"[Agent {agent_id}] Run finished with status: {run.status}"
             )
@@ -204,11 +489,15 @@ class AzureAIAgents:
             if run.status == "failed":
                 self.logger.error(f"[Agent {agent_id}] Run failed.")
 
-            all_messages = self.project.agents.list_messages(thread_id=thread.id)
+            # Foundry returns messages newest-first; only the top few are
+            # needed to find the assistant's reply, so don't fetch the thread.
+            all_messages = await project.agents.list_messages(
+                thread_id=thread.id, limit=5, order="desc"
+            )
             self.logger.info(f"----- Conversation for Agent {agent_id} -----")
 
             final_text = "No response from agent."
-            for msg in reversed(all_messages.data):
+            for msg in all_messages.data:
                 if msg.content and len(msg.content):
                     last_content = msg.content[-1]
                     if isinstance(last_content, MessageTextContent):
@@ -233,7 +522,12 @@ class AzureAIAgents:
         """
         self.logger.debug(f"Attempting to delete agent with ID: {agent_id}")
         try:
-            self.project.agents.delete_agent(assistant_id=agent_id)
+            self._call_with_retry(
+                self.project.agents.delete_agent, assistant_id=agent_id
+            )
+            with self._cache_lock:
+                self._agent_cache.pop(agent_id, None)
+                self._list_cache.clear()
             self.logger.info(f"Successfully deleted agent with ID: {agent_id}")
         except HttpResponseError as e:
             self.logger.error(f"Failed to delete agent {agent_id}", exc_info=True)
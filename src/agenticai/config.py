@@ -0,0 +1,38 @@
+"""
+`config.py` centralizes environment-derived settings for the agentic plugins so
+process-wide constants are read once instead of on every plugin instantiation.
+"""
+import os
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+
+class AgenticConfig(NamedTuple):
+    """Process-wide Azure OpenAI / Foundry settings resolved from the environment."""
+
+    chat_deployment_id: Optional[str]
+    planner_deployment_id: Optional[str]
+    openai_key: Optional[str]
+    openai_endpoint: Optional[str]
+    foundry_connection_string: Optional[str]
+    tracing_enabled: bool
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AgenticConfig:
+    """
+    Read and memoize the environment-derived configuration.
+
+    :return: The frozen AgenticConfig for this process.
+    """
+    chat_deployment_id = os.getenv("AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID")
+    return AgenticConfig(
+        chat_deployment_id=chat_deployment_id,
+        planner_deployment_id=os.getenv(
+            "AZURE_AOAI_PLANNER_MODEL_DEPLOYMENT_ID", chat_deployment_id
+        ),
+        openai_key=os.getenv("AZURE_OPENAI_KEY"),
+        openai_endpoint=os.getenv("AZURE_OPENAI_API_ENDPOINT"),
+        foundry_connection_string=os.getenv("AZURE_AI_FOUNDRY_CONNECTION_STRING"),
+        tracing_enabled=bool(os.getenv("TRAINING_CLOUD_ENABLED")),
+    )
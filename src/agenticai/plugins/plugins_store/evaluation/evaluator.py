@@ -1,13 +1,17 @@
 # WIP
 
+import asyncio
+import hashlib
 import json
 import logging
-import os
 from typing import Annotated, Any, Dict, List
 
+from cachetools import TTLCache
+from pydantic import BaseModel, ValidationError
 from semantic_kernel.functions import kernel_function
 from semantic_kernel.utils.logging import setup_logging
 
+from src.agenticai.config import get_config
 from src.aoai.azure_openai import AzureOpenAIManager
 from src.prompts.prompt_manager import PromptManager
 from utils.ml_logging import get_logger
@@ -16,7 +20,15 @@ from utils.ml_logging import get_logger
 setup_logging()
 logging.getLogger("kernel").setLevel(logging.DEBUG)
 
-TRACING_CLOUD_ENABLED = os.getenv("TRAINING_CLOUD_ENABLED") or False
+TRACING_CLOUD_ENABLED = get_config().tracing_enabled
+
+
+class PolicyEvalResult(BaseModel):
+    """Schema for the evaluator LLM reply, validated in one place."""
+
+    policies: List[str] = []
+    reasoning: List[str] = []
+    retry: bool = False
 
 
 class AIPolicyEvaluationPlugin:
@@ -42,11 +54,10 @@ class AIPolicyEvaluationPlugin:
             self.prompt_manager = PromptManager()
 
         try:
-            azure_openai_chat_deployment_id = os.getenv(
-                "AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID"
-            )
-            azure_openai_key = os.getenv("AZURE_OPENAI_KEY")
-            azure_endpoint = os.getenv("AZURE_OPENAI_API_ENDPOINT")
+            config = get_config()
+            azure_openai_chat_deployment_id = config.chat_deployment_id
+            azure_openai_key = config.openai_key
+            azure_endpoint = config.openai_endpoint
 
             if not all(
                 [azure_openai_chat_deployment_id, azure_openai_key, azure_endpoint]
@@ -61,6 +72,20 @@ class AIPolicyEvaluationPlugin:
                 azure_endpoint=azure_endpoint,
             )
 
+            # Optional small/fast planner model for cheap evaluation passes.
+            planner_deployment_id = config.planner_deployment_id
+            if planner_deployment_id == azure_openai_chat_deployment_id:
+                self.planner_client = self.azure_openai_client
+            else:
+                self.planner_client = AzureOpenAIManager(
+                    api_key=azure_openai_key,
+                    completion_model_name=planner_deployment_id,
+                    # Chat calls route by chat_model_name; without it the
+                    # planner client would fall back to the flagship env var.
+                    chat_model_name=planner_deployment_id,
+                    azure_endpoint=azure_endpoint,
+                )
+
             # Inline fallback system prompt if no PromptManager is used
             self.DEFAULT_SYSTEM_PROMPT = """
             You are a Policy Results Evaluator.
@@ -90,6 +115,39 @@ class AIPolicyEvaluationPlugin:
             - If insufficient info is found, set "retry" to true.
             """
 
+            # Single-flight bookkeeping: concurrent identical evaluations share
+            # one LLM call, and completed results are reusable for a minute.
+            self._inflight: Dict[str, asyncio.Future] = {}
+            self._result_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+            # The system prompt is static, so render it once and derive a stable
+            # prompt cache key from it for Azure OpenAI prompt caching. A
+            # missing template must not break construction: fall back to the
+            # inline default and per-call rendering instead.
+            try:
+                self.system_prompt = self.prompt_manager.get_prompt(
+                    "evaluator_system_prompt.jinja"
+                )
+            except Exception as template_error:
+                self.logger.warning(
+                    f"System prompt template unavailable ({template_error}); "
+                    "using inline default."
+                )
+                self.system_prompt = self.DEFAULT_SYSTEM_PROMPT
+            # Compile the parameterized user template once; rendering it
+            # directly skips the per-call template lookup in PromptManager.
+            try:
+                self._user_tpl = self.prompt_manager.env.get_template(
+                    "evaluator_user_prompt.jinja"
+                )
+            except Exception:
+                # Resolved per call instead; failures stay soft at call time.
+                self._user_tpl = None
+            self.prompt_cache_key = hashlib.blake2b(
+                f"{self.system_prompt}:{azure_openai_chat_deployment_id}".encode(),
+                digest_size=16,
+            ).hexdigest()
+
             self.logger.info("OpenAI client initialized successfully.")
 
         except Exception as e:
@@ -107,14 +165,32 @@ class AIPolicyEvaluationPlugin:
             List[Dict[str, Any]],
             "A list of policy search results (ID, Path, Content, etc.).",
         ],
+        use_planner_model: Annotated[
+            bool,
+            "If True, evaluate with the small/fast planner model deployment instead of the flagship.",
+        ] = False,
+        stream: Annotated[
+            bool,
+            "If True, stream tokens from the LLM as they are generated instead of waiting for the full reply.",
+        ] = False,
+        chunk_size: Annotated[
+            int, "Number of search results evaluated per concurrent LLM call."
+        ] = 8,
     ) -> Annotated[
         dict, "A JSON object with 'policies', 'reasoning', and 'retry' fields."
     ]:
         """
         Evaluate each retrieved policy against the user's query.
 
+        Large result sets are split into chunks of `chunk_size` and evaluated
+        concurrently (bounded by a small semaphore to respect Azure OpenAI rate
+        limits), then merged into a single JSON object.
+
         :param query: The user's question (e.g., "What is the prior authorization policy for Epidiolex...?").
         :param search_results: A list of dictionary items representing policy search results.
+        :param use_planner_model: If True, route the call to the small/fast planner deployment.
+        :param stream: If True, consume the LLM reply incrementally rather than blocking on the full response.
+        :param chunk_size: Number of search results per concurrent evaluation call.
         :return: A JSON object:
             {
               "policies": [...],
@@ -122,28 +198,102 @@ class AIPolicyEvaluationPlugin:
               "retry": false
             }
         """
+        # Single-flight: concurrent identical requests await one shared future,
+        # and recently completed results are served from a short TTL cache.
+        key = hashlib.blake2b(
+            query.encode()
+            + json.dumps(search_results, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self.logger.debug("Evaluation result cache hit.")
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.debug("Joining in-flight evaluation for identical request.")
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._evaluate_policies(
+                query, search_results, use_planner_model, stream, chunk_size
+            )
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        # A retry=True reply (including the error fallback) explicitly asks
+        # the caller to try again, so caching it would serve the failure back
+        # for the TTL instead; only successful evaluations are cached.
+        if not result.get("retry"):
+            self._result_cache[key] = result
+        future.set_result(result)
+        return result
+
+    async def _evaluate_policies(
+        self,
+        query: str,
+        search_results: List[Dict[str, Any]],
+        use_planner_model: bool = False,
+        stream: bool = False,
+        chunk_size: int = 8,
+    ) -> dict:
+        """
+        Run the actual (possibly chunked) evaluation for a single request.
+
+        :param query: The user's prior authorization query.
+        :param search_results: A list of dictionary items representing policy search results.
+        :param use_planner_model: If True, route the call to the planner deployment.
+        :param stream: If True, stream tokens from the LLM.
+        :param chunk_size: Number of search results per concurrent evaluation call.
+        :return: A JSON object with 'policies', 'reasoning', and 'retry' fields.
+        """
         try:
             self.logger.info("Evaluating policy search results...")
 
-            system_prompt = self.prompt_manager.get_prompt(
-                "evaluator_system_prompt.jinja"
-            )
-            user_prompt = self.prompt_manager.create_prompt_evaluator_user(
-                query=query, search_results=search_results
-            )
-            response = await self.azure_openai_client.generate_chat_response(
-                query=user_prompt,
-                system_message_content=system_prompt,
-                conversation_history=[],
-                response_format="json_object",
-                max_tokens=3000,
-                temperature=0.2,
+            if len(search_results) <= chunk_size:
+                return await self._evaluate_chunk(
+                    query, search_results, use_planner_model, stream
+                )
+
+            chunks = [
+                search_results[i : i + chunk_size]
+                for i in range(0, len(search_results), chunk_size)
+            ]
+            semaphore = asyncio.Semaphore(4)
+
+            async def bounded_eval(chunk: List[Dict[str, Any]]) -> dict:
+                async with semaphore:
+                    return await self._evaluate_chunk(
+                        query, chunk, use_planner_model, stream
+                    )
+
+            results = await asyncio.gather(
+                *(bounded_eval(chunk) for chunk in chunks), return_exceptions=True
             )
 
-            llm_reply = response["response"]
+            merged: Dict[str, Any] = {"policies": [], "reasoning": [], "retry": False}
+            seen_policies = set()
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Chunk evaluation failed: {result}")
+                    merged["retry"] = True
+                    continue
+                for policy in result.get("policies", []):
+                    if policy not in seen_policies:
+                        seen_policies.add(policy)
+                        merged["policies"].append(policy)
+                merged["reasoning"].extend(result.get("reasoning", []))
+                merged["retry"] = merged["retry"] or bool(result.get("retry"))
 
-            self.logger.info(f"Evaluation result: {llm_reply}")
-            return llm_reply
+            self.logger.info(f"Merged evaluation result: {merged}")
+            return merged
 
         except Exception as e:
             self.logger.error(f"Error evaluating policies: {e}")
@@ -154,6 +304,97 @@ class AIPolicyEvaluationPlugin:
                 "retry": True,
             }
 
+    @staticmethod
+    def _prune_results(
+        results: List[Dict[str, Any]], max_docs: int = 10, max_chars: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        Trim search results to the fields and sizes the evaluator actually needs.
+
+        Input tokens (and prefill latency) scale with retrieved-doc size, so
+        keep only the top `max_docs` results and cap each content excerpt at
+        `max_chars` characters, dropping ancillary fields.
+
+        :param results: The raw search results.
+        :param max_docs: Maximum number of results to forward to the LLM.
+        :param max_chars: Maximum number of content characters per result.
+        :return: The pruned list of result dictionaries.
+        """
+        # Result key casing varies by retriever ("Content", "content",
+        # "chunk"), so keep every key as-is and only cap the bulky
+        # content-like fields instead of rebuilding each dict.
+        pruned = []
+        for result in results[:max_docs]:
+            trimmed = dict(result)
+            for key, value in trimmed.items():
+                if (
+                    isinstance(value, str)
+                    and key.lower() in ("content", "chunk")
+                    and len(value) > max_chars
+                ):
+                    trimmed[key] = value[:max_chars]
+            pruned.append(trimmed)
+        return pruned
+
+    async def _evaluate_chunk(
+        self,
+        query: str,
+        search_results: List[Dict[str, Any]],
+        use_planner_model: bool = False,
+        stream: bool = False,
+    ) -> dict:
+        """
+        Evaluate a single chunk of search results with one LLM call.
+
+        :param query: The user's prior authorization query.
+        :param search_results: The subset of search results to evaluate.
+        :param use_planner_model: If True, route the call to the planner deployment.
+        :param stream: If True, stream tokens from the LLM.
+        :return: A JSON object with 'policies', 'reasoning', and 'retry' fields.
+        """
+        pruned = self._prune_results(search_results)
+        if self._user_tpl is not None:
+            user_prompt = self._user_tpl.render(query=query, SearchResults=pruned)
+        else:
+            user_prompt = self.prompt_manager.get_prompt(
+                "evaluator_user_prompt.jinja", query=query, SearchResults=pruned
+            )
+        client = (
+            self.planner_client if use_planner_model else self.azure_openai_client
+        )
+        response = await client.generate_chat_response(
+            query=user_prompt,
+            system_message_content=self.system_prompt,
+            conversation_history=[],
+            response_format="json_object",
+            # Generation time scales with tokens produced; the expected JSON
+            # (policies/reasoning/retry) comfortably fits well under 800.
+            max_tokens=800,
+            temperature=0.2,
+            stream=stream,
+            prompt_cache_key=self.prompt_cache_key,
+        )
+
+        llm_reply = response["response"]
+
+        # Validate against the expected schema once here (pydantic v2 parses
+        # JSON strings with its Rust core), so callers never re-parse.
+        try:
+            if isinstance(llm_reply, str):
+                parsed = PolicyEvalResult.model_validate_json(llm_reply)
+            else:
+                parsed = PolicyEvalResult.model_validate(llm_reply)
+        except ValidationError as e:
+            self.logger.error(f"Evaluator reply failed schema validation: {e}")
+            return {
+                "policies": [],
+                "reasoning": ["Invalid JSON structure"],
+                "retry": True,
+            }
+
+        self.logger.info(f"Evaluation result: {parsed}")
+        return parsed.model_dump()
+
     # def verify_json_structure(self, json_string: str) -> dict:
     #     """
     #     Verify the JSON structure to ensure it contains the 'policies', 'reasoning', and 'retry' keys.
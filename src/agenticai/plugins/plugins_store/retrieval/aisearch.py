@@ -15,13 +15,14 @@ from semantic_kernel.functions import kernel_function
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.utils.logging import setup_logging
 
+from src.agenticai.config import get_config
 from utils.ml_logging import get_logger
 
 # Set up logging
 setup_logging()
 logging.getLogger("kernel").setLevel(logging.DEBUG)
 
-TRACING_CLOUD_ENABLED = os.getenv("TRAINING_CLOUD_ENABLED") or False
+TRACING_CLOUD_ENABLED = get_config().tracing_enabled
 
 
 class AzureSearchPlugin:
@@ -120,10 +121,11 @@ class AzureSearchPlugin:
             source_doc_path = (
                 result["parent_path"] if "parent_path" in result else "N/A"
             )
-            content = result["chunk"] if "chunk" in result else "N/A"
+            c = result["chunk"] if "chunk" in result else "N/A"
 
-            # Truncate content to specified number of characters
-            content = content[:truncate] + "..." if len(content) > truncate else content
+            # Truncate content: len() is computed once and the slice only
+            # allocates when the chunk actually exceeds the limit.
+            content = f"{c[:truncate]}..." if len(c) > truncate else c
 
             # Extract caption (highlighted caption if available)
             captions = (
@@ -1,11 +1,15 @@
 # WIP
+import asyncio
+import hashlib
 import logging
-import os
+from enum import IntEnum
 from typing import Annotated, Any, Dict, List
 
+from cachetools import TTLCache
 from semantic_kernel.functions import kernel_function
 from semantic_kernel.utils.logging import setup_logging
 
+from src.agenticai.config import get_config
 from src.aoai.azure_openai import AzureOpenAIManager
 from src.prompts.prompt_manager import PromptManager
 from utils.ml_logging import get_logger
@@ -14,7 +18,19 @@ from utils.ml_logging import get_logger
 setup_logging()
 logging.getLogger("kernel").setLevel(logging.DEBUG)
 
-TRACING_CLOUD_ENABLED = os.getenv("TRAINING_CLOUD_ENABLED") or False
+TRACING_CLOUD_ENABLED = get_config().tracing_enabled
+
+
+class QueryClassification(IntEnum):
+    """Search-mode decision for a query, cheap to compare downstream."""
+
+    KEYWORD = 0
+    SEMANTIC = 1
+
+    @classmethod
+    def from_label(cls, label: str) -> "QueryClassification":
+        """Map an LLM label to the enum, defaulting to SEMANTIC when uncertain."""
+        return cls.KEYWORD if label == "keyword" else cls.SEMANTIC
 
 
 class AIQueryClassificationPlugin:
@@ -41,11 +57,10 @@ class AIQueryClassificationPlugin:
             self.prompt_manager = PromptManager()
 
         try:
-            azure_openai_chat_deployment_id = os.getenv(
-                "AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID"
-            )
-            azure_openai_key = os.getenv("AZURE_OPENAI_KEY")
-            azure_endpoint = os.getenv("AZURE_OPENAI_API_ENDPOINT")
+            config = get_config()
+            azure_openai_chat_deployment_id = config.chat_deployment_id
+            azure_openai_key = config.openai_key
+            azure_endpoint = config.openai_endpoint
 
             if not all(
                 [azure_openai_chat_deployment_id, azure_openai_key, azure_endpoint]
@@ -60,6 +75,21 @@ class AIQueryClassificationPlugin:
                 azure_endpoint=azure_endpoint,
             )
 
+            # Binary keyword/semantic classification does not need the flagship
+            # deployment; route it to a small/fast planner model when configured.
+            planner_deployment_id = config.planner_deployment_id
+            if planner_deployment_id == azure_openai_chat_deployment_id:
+                self.planner_client = self.azure_openai_client
+            else:
+                self.planner_client = AzureOpenAIManager(
+                    api_key=azure_openai_key,
+                    completion_model_name=planner_deployment_id,
+                    # Chat calls route by chat_model_name; without it the
+                    # planner client would fall back to the flagship env var.
+                    chat_model_name=planner_deployment_id,
+                    azure_endpoint=azure_endpoint,
+                )
+
             # If you are *not* using a PromptManager, you can define system prompts inline:
             self.DEFAULT_SYSTEM_PROMPT = """
             You are an intelligent Query Classification Assistant.
@@ -67,6 +97,42 @@ class AIQueryClassificationPlugin:
             ... (system instructions, chain-of-thought, examples, etc.) ...
             """
 
+            # Single-flight bookkeeping: concurrent identical classifications
+            # share one LLM call, and results are reusable for a minute.
+            self._inflight: Dict[str, asyncio.Future] = {}
+            self._result_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+            # Classification is stable for identical query text, so cache the
+            # decision for a day keyed by the normalized query.
+            self._cls_cache: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)
+
+            # The system prompt is static, so render it once and derive a stable
+            # prompt cache key from it for Azure OpenAI prompt caching. A
+            # missing template must not break construction: fall back to the
+            # inline default and per-call rendering instead.
+            try:
+                self.system_prompt = self.prompt_manager.get_prompt(
+                    "query_classificator_system_prompt.jinja"
+                )
+            except Exception as template_error:
+                self.logger.warning(
+                    f"System prompt template unavailable ({template_error}); "
+                    "using inline default."
+                )
+                self.system_prompt = self.DEFAULT_SYSTEM_PROMPT
+            # Compile the parameterized user template once; rendering it
+            # directly skips the per-call template lookup in PromptManager.
+            try:
+                self._user_tpl = self.prompt_manager.env.get_template(
+                    "query_classificator_user_prompt.jinja"
+                )
+            except Exception:
+                # Resolved per call instead; failures stay soft at call time.
+                self._user_tpl = None
+            self.prompt_cache_key = hashlib.blake2b(
+                f"{self.system_prompt}:{azure_openai_chat_deployment_id}".encode(),
+                digest_size=16,
+            ).hexdigest()
+
             self.logger.info("OpenAI client initialized successfully.")
 
         except Exception as e:
@@ -86,36 +152,80 @@ class AIQueryClassificationPlugin:
         :param query_text: The user's search query.
         :return: A JSON object containing the classification result.
         """
+        # Single-flight: concurrent identical queries await one shared future,
+        # and recently classified queries are served from a short TTL cache.
+        key = hashlib.blake2b(query_text.encode(), digest_size=16).hexdigest()
+
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self.logger.debug("Classification result cache hit.")
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.debug("Joining in-flight classification for identical query.")
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        cacheable = True
         try:
-            self.logger.info(f"Classifying query: {query_text}")
-            system_prompt = self.prompt_manager.get_prompt(
-                "query_classificator_system_prompt.jinja"
-            )
-            user_prompt = self.prompt_manager.create_prompt_query_classifier_user(
-                query=query_text
-            )
+            result = await self._classify_query(query_text)
+        except Exception as e:
+            self.logger.error(f"Error during query classification: {e}")
+            # Fallback to 'semantic' if anything goes wrong. A transient LLM
+            # failure must not pin the fallback in the cache, so the write
+            # below is skipped.
+            result = {"classification": QueryClassification.SEMANTIC}
+            cacheable = False
+        finally:
+            self._inflight.pop(key, None)
+
+        if cacheable:
+            self._result_cache[key] = result
+        future.set_result(result)
+        return result
+
+    async def _classify_query(self, query_text: str) -> dict:
+        """
+        Run the actual LLM classification for a single query.
 
-            response = await self.azure_openai_client.generate_chat_response(
-                query=user_prompt,
-                system_message_content=system_prompt,
-                conversation_history=[],
-                response_format="json_object",
-                max_tokens=20,
-                temperature=0,  # ensures more deterministic output
+        :param query_text: The user's search query.
+        :return: A JSON object containing the classification result.
+        """
+        normalized = query_text.strip().lower()
+        cached = self._cls_cache.get(normalized)
+        if cached is not None:
+            self.logger.debug("Classification cache hit for query.")
+            return {"classification": cached}
+
+        self.logger.info(f"Classifying query: {query_text}")
+        if self._user_tpl is not None:
+            user_prompt = self._user_tpl.render(query=query_text)
+        else:
+            user_prompt = self.prompt_manager.create_prompt_query_classifier_user(
+                query_text
             )
 
-            classification = response["response"]
+        response = await self.planner_client.generate_chat_response(
+            query=user_prompt,
+            system_message_content=self.system_prompt,
+            conversation_history=[],
+            response_format="json_object",
+            max_tokens=20,
+            temperature=0,  # ensures more deterministic output
+            prompt_cache_key=self.prompt_cache_key,
+        )
 
-            if classification not in {"keyword", "semantic"}:
-                self.logger.warning(
-                    f"Invalid classification: '{classification}', defaulting to 'semantic'."
-                )
-                classification = "semantic"
+        label = response["response"]
 
-            self.logger.info(f"Query classified as: {classification}")
-            return {"classification": classification}
+        if label not in {"keyword", "semantic"}:
+            self.logger.warning(
+                f"Invalid classification: '{label}', defaulting to 'semantic'."
+            )
+            label = "semantic"
 
-        except Exception as e:
-            self.logger.error(f"Error during query classification: {e}")
-            # fallback to 'semantic' if anything goes wrong
-            return {"classification": "semantic"}
+        classification = QueryClassification.from_label(label)
+        self._cls_cache[normalized] = classification
+        self.logger.info(f"Query classified as: {classification.name}")
+        return {"classification": classification}
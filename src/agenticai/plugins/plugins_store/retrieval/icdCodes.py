@@ -1,8 +1,8 @@
 import logging
-import os
 from typing import List, Tuple
 
-import requests
+import httpx
+from cachetools import LRUCache
 from semantic_kernel.functions import kernel_function
 from semantic_kernel.utils.logging import setup_logging
 
@@ -22,17 +22,33 @@ class ICD10CMPlugin:
         """
         self.logger = logging.getLogger("ICD10CMPlugin")
         self.base_url = "https://clinicaltables.nlm.nih.gov/api/icd10cm/v3/search"
+        # Pooled async client so concurrent lookups share keep-alive connections
+        # instead of blocking the Semantic Kernel event loop on requests.get.
+        self._client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        # Per-term memo: the code list for a given term is stable, and the
+        # LRU bound keeps the cache from growing for the life of the kernel.
+        self._cache: LRUCache = LRUCache(maxsize=1024)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._client.aclose()
 
     @kernel_function(
         name="get_icd10cm_codes",
         description="Retrieve ICD-10-CM codes and descriptions for a given medical term.",
     )
-    def get_icd10cm_codes(
+    async def get_icd10cm_codes(
         self, term: str, max_results: int = 7
     ) -> List[Tuple[str, str]]:
         """
         Retrieve ICD-10-CM codes and descriptions for a given medical term.
 
+        Batch callers can issue many terms concurrently, e.g.
+        `await asyncio.gather(*[plugin.get_icd10cm_codes(t) for t in terms])`.
+
         Parameters:
             term (str): The medical term to search for.
             max_results (int): Maximum number of results to return (default is 7).
@@ -40,11 +56,17 @@ class ICD10CMPlugin:
         Returns:
             List[Tuple[str, str]]: A list containing tuples of ICD-10-CM codes and their descriptions.
         """
+        cache_key = (term, max_results)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         params = {"sf": "code,name", "terms": term, "maxList": max_results}
-        response = requests.get(self.base_url, params=params)
+        response = await self._client.get(self.base_url, params=params)
         if response.status_code == 200:
             data = response.json()
             results = [(item[0], item[1]) for item in data[3]]
+            self._cache[cache_key] = results
             return results
         else:
             self.logger.error(
@@ -0,0 +1,98 @@
+"""
+`semantic_cache.py` provides a small embedding-based response cache: lookups
+return a stored response when the cosine similarity between the query embedding
+and a cached entry exceeds a threshold, so near-identical requests skip the
+LLM round-trip entirely.
+"""
+import time
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Nearest-neighbor cache over normalized embeddings.
+
+    Entries expire after `ttl` seconds and the oldest entries are evicted once
+    `max_entries` is exceeded, bounding both staleness and memory.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        max_entries: int = 10_000,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param threshold: Minimum cosine similarity for a lookup to count as a hit.
+        :param ttl: Seconds an entry stays valid.
+        :param max_entries: Maximum number of cached entries before LRU eviction.
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: List[Any] = []
+        self._timestamps: List[float] = []
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        """Return the embedding as a unit-norm float32 vector."""
+        arr = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(arr)
+        return arr / norm if norm else arr
+
+    def get(self, embedding: Sequence[float]) -> Optional[Any]:
+        """
+        Return the cached response nearest to `embedding` if it clears the
+        similarity threshold, else None.
+
+        :param embedding: The query embedding.
+        :return: The cached response or None on a miss.
+        """
+        self._evict_expired()
+        if self._vectors is None or not self._responses:
+            return None
+
+        scores = self._vectors @ self._normalize(embedding)
+        best = int(np.argmax(scores))
+        if scores[best] > self.threshold:
+            return self._responses[best]
+        return None
+
+    def add(self, embedding: Sequence[float], response: Any) -> None:
+        """
+        Store a response under its embedding, evicting the oldest entries
+        beyond `max_entries`.
+
+        :param embedding: The embedding the response was generated for.
+        :param response: The response object to cache.
+        """
+        vector = self._normalize(embedding)[None, :]
+        self._vectors = (
+            vector if self._vectors is None else np.vstack([self._vectors, vector])
+        )
+        self._responses.append(response)
+        self._timestamps.append(time.monotonic())
+
+        if len(self._responses) > self.max_entries:
+            overflow = len(self._responses) - self.max_entries
+            self._keep(list(range(overflow, len(self._responses))))
+
+    def _evict_expired(self) -> None:
+        """Drop entries older than the TTL."""
+        if not self._timestamps:
+            return
+        cutoff = time.monotonic() - self.ttl
+        keep = [i for i, ts in enumerate(self._timestamps) if ts >= cutoff]
+        if len(keep) != len(self._timestamps):
+            self._keep(keep)
+
+    def _keep(self, indices: List[int]) -> None:
+        """Retain only the entries at the given indices."""
+        self._vectors = self._vectors[indices] if indices else None
+        self._responses = [self._responses[i] for i in indices]
+        self._timestamps = [self._timestamps[i] for i in indices]
@@ -1,27 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import logging
 import os
+import pathlib
 import random
-import string
-from typing import Any, Dict, List, Literal, Optional, Union
-
-from dotenv import load_dotenv
-from semantic_kernel import Kernel
-from semantic_kernel.connectors.ai.chat_completion_client_base import \
-    ChatCompletionClientBase
-from semantic_kernel.connectors.ai.function_choice_behavior import \
-    FunctionChoiceBehavior
-from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
-from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import \
-    AzureChatPromptExecutionSettings
-from semantic_kernel.connectors.ai.prompt_execution_settings import \
-    PromptExecutionSettings
-from semantic_kernel.contents.chat_history import ChatHistory
-from semantic_kernel.functions.kernel_arguments import KernelArguments
-from semantic_kernel.utils.logging import setup_logging
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Dict, List, Literal,
+                    Optional, Union)
 
 from src.agenticai.skills import Skills
 from utils.ml_logging import get_logger
 
+if TYPE_CHECKING:
+    from semantic_kernel import Kernel
+    from semantic_kernel.connectors.ai.function_choice_behavior import \
+        FunctionChoiceBehavior
+    from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
+    from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import \
+        AzureChatPromptExecutionSettings
+    from semantic_kernel.connectors.ai.prompt_execution_settings import \
+        PromptExecutionSettings
+    from semantic_kernel.functions.kernel_arguments import KernelArguments
+
+# Upper bound for the 8-digit agent IDs, hoisted so it is not recomputed per call.
+_ID_MOD = 10**8
+
+# Plugins directory resolved once relative to this file, so agent construction
+# neither re-resolves the path nor depends on the process working directory.
+_PLUGINS_DIR = str(pathlib.Path(__file__).resolve().parent / "plugins" / "plugins_store")
+
+# Module-level logger; agents derive cheap child loggers from it rather than
+# reconfiguring logging per instance.
+logger = get_logger("ChatAgent")
+
+
+@cache
+def _load_env() -> None:
+    """Load .env variables at most once per process, no matter how many agents spin up."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+_load_env()
+
+# Azure OpenAI settings resolved once at import time; explicit __init__
+# arguments still take precedence over these defaults.
+_ENV = types.SimpleNamespace(
+    key=os.getenv("AZURE_OPENAI_KEY"),
+    endpoint=os.getenv("AZURE_OPENAI_API_ENDPOINT"),
+    api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+    deployment=os.getenv("AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID"),
+)
+
 
 class ChatAgent:
     """
@@ -29,6 +64,12 @@ class ChatAgent:
     The agent integrates Azure OpenAI chat services, dynamic plugins, and memory capabilities.
     """
 
+    # Shared AzureChatCompletion services keyed by
+    # (endpoint, deployment, api_version, api_key_hash, service_id): each
+    # service owns an httpx connection pool, so reusing one across agents
+    # avoids repeated TCP/TLS handshakes and file-descriptor churn.
+    _service_cache: Dict[tuple, "AzureChatCompletion"] = {}
+
     def __init__(
         self,
         service_id: Optional[str] = None,
@@ -44,6 +85,8 @@ class ChatAgent:
         azure_openai_endpoint: Optional[str] = None,
         azure_openai_api_version: Optional[str] = None,
         azure_openai_chat_deployment_id: Optional[str] = None,
+        max_concurrency: int = 10,
+        max_history_messages: Optional[int] = None,
     ) -> None:
         """
         Initialize the ChatAgent with optional parameters for service configuration,
@@ -68,64 +111,73 @@ class ChatAgent:
                                          (otherwise from environment variable).
         :param azure_openai_chat_deployment_id: (optional) Override for the Azure OpenAI model deployment name
                                                 (otherwise from environment variable).
+        :param max_concurrency: (optional) Maximum number of chat completions `run_many`
+                                will keep in flight at once (default: 10).
+        :param max_history_messages: (optional) Cap on retained chat history
+                                     messages; the oldest non-system messages are
+                                     dropped beyond it. None keeps everything.
 
         :raises ValueError: If required environment variables for Azure OpenAI are missing
                            (and are not passed explicitly).
         """
 
-        load_dotenv()
-
         self.name = name
         self.tracing_enabled = tracing_enabled
+        self.max_concurrency = max_concurrency
+        self.max_history_messages = max_history_messages
         if id is None:
             self.id = self._generate_8digit_id()
         else:
             self.id = id
 
         # Logging
-        self._setup_logging()
-        self.logger = get_logger(
-            name=f"ChatAgent-{self.name}" if self.name else "ChatAgent",
-            level=10,
-        )
+        self.logger = logger.getChild(self.name or self.id)
         if tracing_enabled:
             pass
         self.description = description
         self.instructions = instructions
 
         # Immediately record these core pieces of context in the conversation
+        from semantic_kernel.contents.chat_history import ChatHistory
+
         self.chat_history = ChatHistory()
+        # Digests of messages already injected, so repeated description /
+        # instruction re-adds don't duplicate context every turn.
+        self._injected_system: set = set()
+        self._injected_user: set = set()
         if description:
             self.add_system_message(description)
         if instructions:
             self.add_user_message(instructions)
 
-        self.AZURE_OPENAI_KEY = azure_openai_key or os.getenv("AZURE_OPENAI_KEY")
-        self.AZURE_OPENAI_API_ENDPOINT = azure_openai_endpoint or os.getenv(
-            "AZURE_OPENAI_API_ENDPOINT"
-        )
-        self.AZURE_OPENAI_API_VERSION = azure_openai_api_version or os.getenv(
-            "AZURE_OPENAI_API_VERSION"
-        )
+        self.AZURE_OPENAI_KEY = azure_openai_key or _ENV.key
+        self.AZURE_OPENAI_API_ENDPOINT = azure_openai_endpoint or _ENV.endpoint
+        self.AZURE_OPENAI_API_VERSION = azure_openai_api_version or _ENV.api_version
         self.AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID = (
-            azure_openai_chat_deployment_id
-            or os.getenv("AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID")
+            azure_openai_chat_deployment_id or _ENV.deployment
         )
 
-        # Define the four required variables in a dictionary
-        required_vars = {
-            "AZURE_OPENAI_KEY": self.AZURE_OPENAI_KEY,
-            "AZURE_OPENAI_API_ENDPOINT": self.AZURE_OPENAI_API_ENDPOINT,
-            "AZURE_OPENAI_API_VERSION": self.AZURE_OPENAI_API_VERSION,
-            "AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID": self.AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID,
-        }
-
-        # Collect any that are missing or empty
-        missing_vars = [
-            var_name for var_name, var_value in required_vars.items() if not var_value
-        ]
-
-        if missing_vars:
+        # Fast path: one short-circuiting boolean check; the per-name scan
+        # only runs (and allocates) when something is actually missing.
+        if not (
+            self.AZURE_OPENAI_KEY
+            and self.AZURE_OPENAI_API_ENDPOINT
+            and self.AZURE_OPENAI_API_VERSION
+            and self.AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID
+        ):
+            missing_vars = tuple(
+                name
+                for name, value in (
+                    ("AZURE_OPENAI_KEY", self.AZURE_OPENAI_KEY),
+                    ("AZURE_OPENAI_API_ENDPOINT", self.AZURE_OPENAI_API_ENDPOINT),
+                    ("AZURE_OPENAI_API_VERSION", self.AZURE_OPENAI_API_VERSION),
+                    (
+                        "AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID",
+                        self.AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID,
+                    ),
+                )
+                if not value
+            )
             # Print or log the missing variables
             self.logger.error(
                 "The following Azure OpenAI settings are missing: %s",
@@ -146,9 +198,7 @@ class ChatAgent:
         )
 
         # Skill management
-        self._skills_manager = Skills(
-            parent_directory=os.path.abspath("src/agenticai/plugins/plugins_store")
-        )
+        self._skills_manager = Skills(parent_directory=_PLUGINS_DIR)
         if skills:
             self.load_skills(skills)
 
@@ -162,8 +212,6 @@ class ChatAgent:
             ]
         ] = None
 
-        self.chat_completion: Optional[AzureChatCompletion] = None
-
         # Log the agent creation with agentic planner information
         self.logger.info(
             "Created ChatAgent '%s' (ID: %s) with service '%s', planner_config=%s, planner_behavior=%s, skills=%s",
@@ -178,10 +226,10 @@ class ChatAgent:
     @staticmethod
     def _generate_8digit_id() -> str:
         """
-        Generate an 8-digit numeric string (e.g., '49382716')
-        using random.choices for clarity and flexibility.
+        Generate an 8-digit numeric string (e.g., '49382716') with a single
+        C-level draw instead of eight per-character choices.
         """
-        return "".join(random.choices(string.digits, k=8))
+        return f"{random.randrange(_ID_MOD):08d}"
 
     def _initialize_kernel(self, service_id: str) -> Kernel:
         """
@@ -191,18 +239,37 @@ class ChatAgent:
         :return: Configured Kernel instance.
         :raises Exception: If adding or retrieving the Azure ChatCompletion service fails.
         """
+        # Imported lazily: pulling in the kernel and connector stack at module
+        # import time dominates cold start for callers that never build one.
+        from semantic_kernel import Kernel
+        from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
+
         try:
             kernel = Kernel()
-            kernel.add_service(
-                AzureChatCompletion(
+            # Hash the key so the cache never retains raw credentials.
+            cache_key = (
+                self.AZURE_OPENAI_API_ENDPOINT,
+                self.AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID,
+                self.AZURE_OPENAI_API_VERSION,
+                hashlib.blake2b(
+                    self.AZURE_OPENAI_KEY.encode(), digest_size=8
+                ).hexdigest(),
+                service_id,
+            )
+            service = self._service_cache.get(cache_key)
+            if service is None:
+                service = AzureChatCompletion(
                     service_id=service_id,
                     deployment_name=self.AZURE_AOAI_CHAT_MODEL_NAME_DEPLOYMENT_ID,
                     api_key=self.AZURE_OPENAI_KEY,
                     endpoint=self.AZURE_OPENAI_API_ENDPOINT,
                     api_version=self.AZURE_OPENAI_API_VERSION,
                 )
-            )
-            # Attempt to retrieve the service by type, if available in your environment
+                self._service_cache[cache_key] = service
+            kernel.add_service(service)
+            # The service already is a ChatCompletionClientBase, so record it
+            # directly and skip the kernel.get_service lookup in run().
+            self.chat_completion = service
             return kernel
 
         except Exception as e:
@@ -219,25 +286,15 @@ class ChatAgent:
 
         :return: Execution settings instance.
         """
+        from semantic_kernel.connectors.ai.function_choice_behavior import \
+            FunctionChoiceBehavior
+        from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import \
+            AzureChatPromptExecutionSettings
+
         planner_config = AzureChatPromptExecutionSettings()
         planner_config.function_choice_behavior = FunctionChoiceBehavior.Auto()
         return planner_config
 
-    def _setup_logging(self) -> logging.Logger:
-        """
-        Set up logging for the agent.
-
-        :return: Configured Logger instance.
-        """
-        logging.basicConfig(
-            format="[%(asctime)s - %(name)s:%(lineno)d - %(levelname)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        setup_logging()
-        logger = get_logger("ChatAgent")
-        logger.setLevel(logging.INFO)
-        return logger
-
     def set_planner_execution_settings(
         self,
         temperature: Optional[float] = None,
@@ -290,7 +347,11 @@ class ChatAgent:
 
         self.planner_config.stream = stream
 
-        self.logger.info("Prompt settings updated: %s", self.planner_config.dict())
+        # Building the settings dict is only worth it if the record is emitted.
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Prompt settings updated: %s", self.planner_config.dict()
+            )
 
     def set_planner_behavior(
         self,
@@ -318,6 +379,9 @@ class ChatAgent:
                 - "NoneInvoke": Do not invoke, but can describe them.
                 - "Required": Must use at least one function to answer.
         """
+        from semantic_kernel.connectors.ai.function_choice_behavior import \
+            FunctionChoiceBehavior
+
         behavior = FunctionChoiceBehavior(
             enable_kernel_functions=enable_kernel_functions,
             maximum_auto_invoke_attempts=max_auto_invoke_attempts,
@@ -364,21 +428,53 @@ class ChatAgent:
 
         :param message: System message that defines the assistant's role or higher-level instructions.
         """
+        digest = hashlib.blake2b(message.encode("utf-8"), digest_size=8).digest()
+        if digest in self._injected_system:
+            return
+        self._injected_system.add(digest)
         self.chat_history.add_system_message(message)
 
     def add_user_message(self, message: str) -> None:
         """
         Add a user message to the chat history.
 
+        Deduplication is scoped to the agent's `instructions` injection:
+        ordinary user turns may legitimately repeat ("yes", "continue") and
+        must each land in the history.
+
         :param message: User query or input.
         """
+        if self.instructions is not None and message == self.instructions:
+            digest = hashlib.blake2b(message.encode("utf-8"), digest_size=8).digest()
+            if digest in self._injected_user:
+                return
+            self._injected_user.add(digest)
         self.chat_history.add_user_message(message)
 
+    def _trim_chat_history(self) -> None:
+        """
+        Enforce `max_history_messages` by dropping the oldest non-system
+        messages; system messages stay pinned so the agent's role survives
+        trimming. No-op when no cap is set.
+        """
+        cap = self.max_history_messages
+        messages = self.chat_history.messages
+        if cap is None or len(messages) <= cap:
+            return
+        system = [m for m in messages if m.role == "system"]
+        rest = [m for m in messages if m.role != "system"]
+        keep = max(cap - len(system), 0)
+        self.chat_history.messages = system + (rest[-keep:] if keep else [])
+
     def clear_chat_history(self) -> None:
         """
         Clear the current chat history. This can be useful if you want to reset the conversation context.
         """
+        from semantic_kernel.contents.chat_history import ChatHistory
+
         self.chat_history = ChatHistory()
+        self._injected_system.clear()
+        self._injected_user.clear()
         self.logger.info("Chat history cleared.")
 
     async def run(
@@ -393,6 +489,7 @@ class ChatAgent:
                 Dict[str, PromptExecutionSettings],
             ]
         ] = None,
+        stateless: bool = False,
     ) -> str:
         """
         Execute the agent's main functionality with the given prompts,
@@ -405,39 +502,42 @@ class ChatAgent:
             If a key overlaps, the value here overrides the default.
         :param run_settings: A custom PromptExecutionSettings, list of them, or dict of them
             keyed by service_id to override default kernel settings for this single call.
+        :param stateless: If True, run against a throwaway ChatHistory for this
+            call only; the agent's conversation state is neither read nor grown,
+            avoiding the per-call token growth of long-lived agents.
         :return: AI response as a string.
         """
-        if system_prompt is not None:
-            self.add_system_message(system_prompt)
-        if user_prompt is not None:
-            self.add_user_message(user_prompt)
+        from semantic_kernel.connectors.ai.chat_completion_client_base import \
+            ChatCompletionClientBase
+        from semantic_kernel.contents.chat_history import ChatHistory
+        from semantic_kernel.functions.kernel_arguments import KernelArguments
+
+        if stateless:
+            history = ChatHistory()
+            if system_prompt is not None:
+                history.add_system_message(system_prompt)
+            if user_prompt is not None:
+                history.add_user_message(user_prompt)
+        else:
+            if system_prompt is not None:
+                self.add_system_message(system_prompt)
+            if user_prompt is not None:
+                self.add_user_message(user_prompt)
+            self._trim_chat_history()
+            history = self.chat_history
 
         try:
-            # Prepare the KernelArguments:
-            # 1. Start with any user-defined default args
-            # 2. Merge in run_arguments if provided (overrides defaults)
-            final_args = self._default_kernel_arguments.copy()
-            if run_arguments is not None:
-                final_args.update(run_arguments)
-
-            # Also handle custom settings if provided, else fall back to defaults
-            final_settings = (
-                run_settings
-                if run_settings is not None
-                else self._default_kernel_settings
+            args_for_kernel = self._build_kernel_arguments(
+                user_prompt, run_arguments, run_settings
             )
 
-            # Construct KernelArguments
-            args_for_kernel = KernelArguments(settings=final_settings, **final_args)
-            args_for_kernel["input"] = user_prompt
-
             if self.chat_completion is None:
                 self.chat_completion: AzureChatCompletion = self.kernel.get_service(
                     type=ChatCompletionClientBase
                 )
 
             result = await self.chat_completion.get_chat_message_contents(
-                chat_history=self.chat_history,
+                chat_history=history,
                 settings=self.planner_config,
                 kernel=self.kernel,
                 arguments=args_for_kernel,
@@ -449,6 +549,181 @@ class ChatAgent:
             self.logger.error("Error while processing request: %s", e, exc_info=True)
             raise
 
+    async def run_stream(
+        self,
+        system_prompt: Optional[str] = None,
+        user_prompt: Optional[str] = None,
+        run_arguments: Optional[Dict[str, Any]] = None,
+        run_settings: Optional[
+            Union[
+                PromptExecutionSettings,
+                List[PromptExecutionSettings],
+                Dict[str, PromptExecutionSettings],
+            ]
+        ] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Execute the agent like `run(...)` but yield response chunks as they
+        arrive, so callers can start post-processing (or forwarding to another
+        LLM stage) after the first token instead of after the last.
+
+        :param system_prompt: The system prompt to set the assistant's role or global instructions.
+        :param user_prompt: The user query or task description.
+        :param run_arguments: A dict of additional KernelArguments for this single call.
+        :param run_settings: A custom PromptExecutionSettings override, as in `run(...)`.
+        :return: An async iterator of streaming message content chunks.
+        """
+        from semantic_kernel.connectors.ai.chat_completion_client_base import \
+            ChatCompletionClientBase
+
+        if system_prompt is not None:
+            self.add_system_message(system_prompt)
+        if user_prompt is not None:
+            self.add_user_message(user_prompt)
+
+        try:
+            args_for_kernel = self._build_kernel_arguments(
+                user_prompt, run_arguments, run_settings
+            )
+
+            if self.chat_completion is None:
+                self.chat_completion = self.kernel.get_service(
+                    type=ChatCompletionClientBase
+                )
+
+            # Flag streaming on the settings for this path only.
+            previous_stream = self.planner_config.stream
+            self.planner_config.stream = True
+            try:
+                async for messages in self.chat_completion.get_streaming_chat_message_contents(
+                    chat_history=self.chat_history,
+                    settings=self.planner_config,
+                    kernel=self.kernel,
+                    arguments=args_for_kernel,
+                ):
+                    if messages:
+                        yield messages[0]
+            finally:
+                self.planner_config.stream = previous_stream
+
+        except Exception as e:
+            self.logger.error(
+                "Error while streaming request: %s", e, exc_info=True
+            )
+            raise
+
+    def _build_kernel_arguments(
+        self,
+        user_prompt: Optional[str],
+        run_arguments: Optional[Dict[str, Any]],
+        run_settings: Optional[
+            Union[
+                PromptExecutionSettings,
+                List[PromptExecutionSettings],
+                Dict[str, PromptExecutionSettings],
+            ]
+        ],
+    ) -> "KernelArguments":
+        """
+        Merge default and per-call kernel arguments/settings into a
+        KernelArguments instance shared by `run` and `run_stream`.
+
+        :param user_prompt: The user prompt assigned to the "input" argument.
+        :param run_arguments: Per-call argument overrides (win over defaults).
+        :param run_settings: Per-call settings override (wins over defaults).
+        :return: The assembled KernelArguments.
+        """
+        from semantic_kernel.functions.kernel_arguments import KernelArguments
+
+        # No per-call overrides: skip the merge logic, but still hand every
+        # call its own KernelArguments — concurrent run()/run_stream() calls
+        # must not share a mutable "input" slot.
+        if run_arguments is None and run_settings is None:
+            args_for_kernel = KernelArguments(
+                settings=self._default_kernel_settings,
+                **self._default_kernel_arguments,
+            )
+            args_for_kernel["input"] = user_prompt
+            return args_for_kernel
+
+        final_args = self._default_kernel_arguments.copy()
+        if run_arguments is not None:
+            final_args.update(run_arguments)
+
+        final_settings = (
+            run_settings if run_settings is not None else self._default_kernel_settings
+        )
+
+        args_for_kernel = KernelArguments(settings=final_settings, **final_args)
+        args_for_kernel["input"] = user_prompt
+        return args_for_kernel
+
+    async def run_many(
+        self,
+        user_prompts: List[str],
+        system_prompt: Optional[str] = None,
+        run_settings: Optional[
+            Union[
+                PromptExecutionSettings,
+                List[PromptExecutionSettings],
+                Dict[str, PromptExecutionSettings],
+            ]
+        ] = None,
+    ) -> List[str]:
+        """
+        Execute many independent prompts concurrently, overlapping the network
+        round-trips instead of serializing them.
+
+        Each prompt gets its own ChatHistory so concurrent calls never share
+        conversation state; in-flight requests are bounded by the agent's
+        `max_concurrency`.
+
+        :param user_prompts: The list of user prompts to answer.
+        :param system_prompt: Optional system prompt applied to every call
+            (falls back to the agent's description, if any).
+        :param run_settings: Optional PromptExecutionSettings override shared
+            by all calls, as in `run(...)`.
+        :return: AI responses in the same order as `user_prompts`.
+        """
+        from semantic_kernel.connectors.ai.chat_completion_client_base import \
+            ChatCompletionClientBase
+        from semantic_kernel.contents.chat_history import ChatHistory
+        from semantic_kernel.functions.kernel_arguments import KernelArguments
+
+        if self.chat_completion is None:
+            self.chat_completion = self.kernel.get_service(
+                type=ChatCompletionClientBase
+            )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        final_settings = (
+            run_settings if run_settings is not None else self._default_kernel_settings
+        )
+
+        async def _one(prompt: str) -> str:
+            history = ChatHistory()
+            if system_prompt is not None:
+                history.add_system_message(system_prompt)
+            elif self.description:
+                history.add_system_message(self.description)
+            history.add_user_message(prompt)
+
+            args_for_kernel = KernelArguments(
+                settings=final_settings, **self._default_kernel_arguments
+            )
+            args_for_kernel["input"] = prompt
+
+            async with semaphore:
+                result = await self.chat_completion.get_chat_message_contents(
+                    chat_history=history,
+                    settings=self.planner_config,
+                    kernel=self.kernel,
+                    arguments=args_for_kernel,
+                )
+            return result[0] if result else ""
+
+        return await asyncio.gather(*(_one(prompt) for prompt in user_prompts))
+
     def add_plugin(self, parent_directory: str, plugin_name: str) -> None:
         """
         Add a plugin to the kernel.
@@ -474,15 +749,33 @@ class ChatAgent:
         :param skills: A list of skill names to load, where valid options might be
             ["retrieval", "main", "rewriting", "evaluation"], etc.
         """
+        if not skills:
+            return
+
         self._skills_manager.load_skills(skills)
-        for skill_name in skills:
+
+        from semantic_kernel.functions import KernelPlugin
+
+        def _load(skill_name: str) -> "KernelPlugin":
             plugin = self._skills_manager.get_skill(skill_name)
             plugin_path = plugin.directory
             parent_dir = os.path.dirname(plugin_path)
             name = os.path.basename(plugin_path)
-            try:
-                self.kernel.add_plugin(parent_directory=parent_dir, plugin_name=name)
-                self.logger.info("Skill loaded: %s", skill_name)
-            except Exception as e:
-                self.logger.error("Failed to load skill: %s", skill_name, exc_info=True)
-                raise
+            return KernelPlugin.from_directory(
+                plugin_name=name, parent_directory=parent_dir
+            )
+
+        # Building a plugin walks directories on disk, so overlap that I/O
+        # across skills. Kernel registration mutates shared kernel state and
+        # is not documented thread-safe, so add_plugin runs on this thread.
+        with ThreadPoolExecutor(max_workers=min(8, len(skills))) as executor:
+            futures = {executor.submit(_load, s): s for s in skills}
+            for future, skill_name in futures.items():
+                try:
+                    self.kernel.add_plugin(future.result())
+                    self.logger.info("Skill loaded: %s", skill_name)
+                except Exception:
+                    self.logger.error(
+                        "Failed to load skill: %s", skill_name, exc_info=True
+                    )
+                    raise
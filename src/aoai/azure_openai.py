@@ -17,6 +17,7 @@ import requests
 from dotenv import load_dotenv
 from openai import AzureOpenAI
 
+from src.aoai.shared_client import get_shared_client
 from src.aoai.tokenizer import AzureOpenAITokenizer
 from src.aoai.utils import extract_rate_limit_and_usage_info
 from utils.ml_logging import get_logger
@@ -46,6 +47,7 @@ class AzureOpenAIManager:
         embedding_model_name: Optional[str] = None,
         dalle_model_name: Optional[str] = None,
         whisper_model_name: Optional[str] = None,
+        openai_client: Optional[AzureOpenAI] = None,
     ):
         """
         Initializes the Azure OpenAI Manager with necessary configurations.
@@ -57,11 +59,13 @@ class AzureOpenAIManager:
         :param chat_model_name: The Chat Model Name. If not provided, it will be fetched from the environment variable "AZURE_AOAI_CHAT_MODEL_NAME".
         :param embedding_model_name: The Embedding Model Deployment ID. If not provided, it will be fetched from the environment variable "AZURE_AOAI_EMBEDDING_DEPLOYMENT_ID".
         :param dalle_model_name: The DALL-E Model Deployment ID. If not provided, it will be fetched from the environment variable "AZURE_AOAI_DALLE_MODEL_DEPLOYMENT_ID".
+        :param openai_client: An already-configured AzureOpenAI client to use. If not provided, a process-wide shared client with a pooled HTTP transport is used.
 
         """
         self.api_key = api_key or os.getenv("AZURE_OPENAI_KEY")
+        # 2024-10-21 is the first GA version with automatic prompt caching.
         self.api_version = (
-            api_version or os.getenv("AZURE_OPENAI_API_VERSION") or "2024-02-01"
+            api_version or os.getenv("AZURE_OPENAI_API_VERSION") or "2024-10-21"
         )
         self.azure_endpoint = azure_endpoint or os.getenv("AZURE_OPENAI_API_ENDPOINT")
         self.completion_model_name = completion_model_name or os.getenv(
@@ -82,10 +86,10 @@ class AzureOpenAIManager:
             "AZURE_AOAI_WHISPER_MODEL_DEPLOYMENT_ID"
         )
 
-        self.openai_client = AzureOpenAI(
-            api_key=self.api_key,
-            api_version=self.api_version,
-            azure_endpoint=self.azure_endpoint,
+        # Reuse the process-wide client so every manager instance shares one
+        # connection pool instead of opening its own transport.
+        self.openai_client = openai_client or get_shared_client(
+            self.api_key, self.api_version, self.azure_endpoint
         )
 
         self.tokenizer = AzureOpenAITokenizer()
@@ -344,6 +348,7 @@ class AzureOpenAIManager:
         tools: List[Dict[str, Any]] = None,
         tool_choice: Union[str, Dict[str, Any]] = None,
         response_format: Union[str, Dict[str, Any]] = "text",
+        prompt_cache_key: Optional[str] = None,
         **kwargs,
     ) -> Optional[Union[str, Dict[str, Any]]]:
         """
@@ -364,6 +369,8 @@ class AzureOpenAIManager:
         :param response_format: Specifies the format of the response. Can be:
             - A string: "text" or "json_object".
             - A dictionary specifying a custom response format, including a JSON schema when needed.
+        :param prompt_cache_key: Stable key routing requests with the same prompt prefix
+            to the same cache shard, improving Azure OpenAI prompt-cache hit rates.
         :return: The generated text response as a string if response_format is "text", or a dictionary containing the response and conversation history if response_format is "json_object". Returns None if an error occurs.
         """
         start_time = time.time()
@@ -444,6 +451,11 @@ class AzureOpenAIManager:
                     "Invalid response_format. Must be a string or a dictionary."
                 )
 
+            if prompt_cache_key is not None:
+                kwargs.setdefault("extra_body", {})[
+                    "prompt_cache_key"
+                ] = prompt_cache_key
+
             response = self.openai_client.chat.completions.create(
                 model=self.chat_model_name,
                 messages=messages_for_api,
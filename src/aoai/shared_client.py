@@ -0,0 +1,58 @@
+"""
+`shared_client.py` provides process-wide Azure OpenAI clients backed by pooled
+HTTP transports, so concurrent plugin calls reuse warm connections instead of
+paying a TLS handshake per client instance.
+"""
+import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from openai import AsyncAzureOpenAI, AzureOpenAI
+
+_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+@lru_cache(maxsize=8)
+def get_shared_client(
+    api_key: Optional[str] = None,
+    api_version: Optional[str] = None,
+    azure_endpoint: Optional[str] = None,
+) -> AzureOpenAI:
+    """
+    Returns a memoized synchronous AzureOpenAI client for the given credentials.
+
+    :param api_key: The Azure OpenAI key (falls back to "AZURE_OPENAI_KEY").
+    :param api_version: The API version (falls back to "AZURE_OPENAI_API_VERSION").
+    :param azure_endpoint: The endpoint (falls back to "AZURE_OPENAI_API_ENDPOINT").
+    :return: A shared AzureOpenAI client with a pooled HTTP transport.
+    """
+    return AzureOpenAI(
+        api_key=api_key or os.getenv("AZURE_OPENAI_KEY"),
+        api_version=api_version or os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-01"),
+        azure_endpoint=azure_endpoint or os.getenv("AZURE_OPENAI_API_ENDPOINT"),
+        http_client=httpx.Client(limits=_POOL_LIMITS, timeout=_TIMEOUT),
+    )
+
+
+@lru_cache(maxsize=8)
+def get_shared_async_client(
+    api_key: Optional[str] = None,
+    api_version: Optional[str] = None,
+    azure_endpoint: Optional[str] = None,
+) -> AsyncAzureOpenAI:
+    """
+    Returns a memoized AsyncAzureOpenAI client for the given credentials.
+
+    :param api_key: The Azure OpenAI key (falls back to "AZURE_OPENAI_KEY").
+    :param api_version: The API version (falls back to "AZURE_OPENAI_API_VERSION").
+    :param azure_endpoint: The endpoint (falls back to "AZURE_OPENAI_API_ENDPOINT").
+    :return: A shared AsyncAzureOpenAI client with a pooled HTTP transport.
+    """
+    return AsyncAzureOpenAI(
+        api_key=api_key or os.getenv("AZURE_OPENAI_KEY"),
+        api_version=api_version or os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-01"),
+        azure_endpoint=azure_endpoint or os.getenv("AZURE_OPENAI_API_ENDPOINT"),
+        http_client=httpx.AsyncClient(limits=_POOL_LIMITS, timeout=_TIMEOUT),
+    )
@@ -1,7 +1,10 @@
+import hashlib
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import (Environment, FileSystemBytecodeCache, FileSystemLoader,
+                    Template)
 from pydantic import BaseModel
 
 from utils.ml_logging import get_logger
@@ -9,6 +12,30 @@ from utils.ml_logging import get_logger
 logger = get_logger()
 
 
+def _build_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Persist compiled template bytecode on disk so new worker processes skip
+    the parse/compile pipeline on cold start. Jinja unmarshals whatever is in
+    this directory, so it must be per-user and private (0700) rather than the
+    shared $TMPDIR. Returns None when no writable cache directory is
+    available.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    directory = os.path.join(base, "jinja_bcc")
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        os.chmod(directory, 0o700)
+    except OSError:
+        logger.warning("Jinja bytecode cache disabled: %s not writable", directory)
+        return None
+    return FileSystemBytecodeCache(directory=directory, pattern="__jinja2_%s.cache")
+
+
+_BYTECODE_CACHE = _build_bytecode_cache()
+
+
 class PromptManager:
     def __init__(self, template_dir: str = "templates"):
         """
@@ -20,12 +47,64 @@ class PromptManager:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         template_path = os.path.join(current_dir, template_dir)
 
+        # The prompt set is small and fixed, so skip Jinja's auto-reload stat
+        # on every lookup and keep all compiled templates cached.
         self.env = Environment(
-            loader=FileSystemLoader(searchpath=template_path), autoescape=False
+            loader=FileSystemLoader(searchpath=template_path),
+            autoescape=False,
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=_BYTECODE_CACHE,
         )
 
-        templates = self.env.list_templates()
-        print(f"Templates found: {templates}")
+        # Instance-level cache of compiled templates, bypassing even the
+        # Environment's own lookup on repeat renders.
+        self._template_cache: Dict[str, Template] = {}
+
+        # The three hot prompt templates are compiled once here and their
+        # bound render methods stored, so each create_prompt_* call is a
+        # single attribute lookup plus render. A missing template must not
+        # break construction, so binding falls back to a per-call lookup.
+        self._render_classifier = self._bind_render(
+            "query_classificator_user_prompt.jinja"
+        )
+        self._render_formulator = self._bind_render("formulator_user_prompt.jinja")
+        self._render_evaluator = self._bind_render("evaluator_user_prompt.jinja")
+
+        # Memoize rendered prompts: identical classifier queries recur often,
+        # so the render is skipped entirely on repeats. Evaluator results are
+        # unhashable dicts, so that cache is keyed manually below.
+        self._cached_classifier = lru_cache(maxsize=1024)(self._render_classifier)
+        self._evaluator_cache: Dict[tuple, str] = {}
+
+        logger.debug("Templates found: %s", self.env.list_templates())
+
+    def _bind_render(self, template_name: str):
+        """
+        Return the template's bound render method, compiled eagerly when the
+        template resolves. If it cannot be loaded at construction time, return
+        a per-call fallback so the failure surfaces when the prompt is
+        actually requested, as before.
+
+        Args:
+            template_name (str): The name of the template file.
+
+        Returns:
+            Callable[..., str]: A render callable for the template.
+        """
+        try:
+            return self.env.get_template(template_name).render
+        except Exception as e:
+            logger.warning(
+                "Template '%s' not loaded at init (%s); deferring to per-call lookup",
+                template_name,
+                e,
+            )
+
+            def _render(**kwargs) -> str:
+                return self.get_prompt(template_name, **kwargs)
+
+            return _render
 
     def get_prompt(self, template_name: str, **kwargs) -> str:
         """
@@ -39,7 +118,11 @@ class PromptManager:
             str: The rendered template as a string.
         """
         try:
-            template = self.env.get_template(template_name)
+            template = self._template_cache.get(template_name)
+            if template is None:
+                template = self._template_cache.setdefault(
+                    template_name, self.env.get_template(template_name)
+                )
             return template.render(**kwargs)
         except Exception as e:
             raise ValueError(f"Error rendering template '{template_name}': {e}")
@@ -55,10 +138,7 @@ class PromptManager:
             str: The rendered prompt (query_classifier_user_prompt.jinja) with instructions
                  on classifying the query as 'keyword' or 'semantic'.
         """
-        return self.get_prompt(
-            "query_classificator_user_prompt.jinja",
-            query=query,
-        )
+        return self._cached_classifier(query=query)
 
     def create_prompt_formulator_user(
         self,
@@ -84,8 +164,7 @@ class PromptManager:
             str: The rendered prompt (formulator_user_prompt.jinja) that guides how to
                  construct an optimized search query with synonyms, related terms, etc.
         """
-        return self.get_prompt(
-            "formulator_user_prompt.jinja",
+        return self._render_formulator(
             diagnosis=diagnosis,
             medication_or_procedure=medication_or_procedure,
             code=code,
@@ -114,8 +193,34 @@ class PromptManager:
                  evaluate these policies against the query, deduplicate, and form
                  a final JSON-like response.
         """
-        return self.get_prompt(
-            "evaluator_user_prompt.jinja",
-            query=query,
-            SearchResults=search_results,
+        # search_results is a list of dicts and cannot feed lru_cache, so the
+        # cache key is built from the query plus each result's identity.
+        # Retriever key casing varies (id/chunk_id, content/Content/chunk),
+        # so identity fields are fetched defensively and a content digest is
+        # included so changed content for the same id never serves a stale
+        # prompt.
+        key = (
+            query,
+            tuple(
+                (
+                    r.get("id") or r.get("chunk_id"),
+                    r.get("caption", ""),
+                    hashlib.blake2b(
+                        str(
+                            r.get("content") or r.get("Content") or r.get("chunk") or ""
+                        ).encode("utf-8"),
+                        digest_size=8,
+                    ).digest(),
+                )
+                for r in search_results
+            ),
         )
+        prompt = self._evaluator_cache.get(key)
+        if prompt is None:
+            if len(self._evaluator_cache) >= 1024:
+                self._evaluator_cache.clear()
+            prompt = self._evaluator_cache.setdefault(
+                key,
+                self._render_evaluator(query=query, SearchResults=search_results),
+            )
+        return prompt
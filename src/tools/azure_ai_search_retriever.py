@@ -1,9 +1,12 @@
+import asyncio
 import logging
+import operator
 import os
+from dataclasses import dataclass
 from typing import Annotated, Any, Dict, List
 
 from azure.core.credentials import AzureKeyCredential
-from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient
 from azure.search.documents.models import (QueryAnswerType, QueryCaptionType,
                                            QueryType, VectorizableTextQuery)
 
@@ -13,22 +16,38 @@ from utils.ml_logging import get_logger
 logger = get_logger(name="AzureSearchFunctions", level=logging.DEBUG)
 
 
+@dataclass(frozen=True, slots=True)
+class _AzSearchCfg:
+    """Azure AI Search settings read once at import instead of per call."""
+
+    endpoint: str
+    index: str
+    key: str
+
+
+_CFG = _AzSearchCfg(
+    endpoint=os.getenv("AZURE_AI_SEARCH_SERVICE_ENDPOINT_SCENARIO_1"),
+    index=os.getenv("AZURE_SEARCH_INDEX_NAME_SCENARIO_1"),
+    key=os.getenv("AZURE_AI_SEARCH_ADMIN_KEY_SCENARIO_1"),
+)
+
+
 def init_search_client() -> SearchClient:
     """
-    Initializes the Azure Search client using environment variables.
+    Initializes the async Azure Search client from the cached configuration.
+
+    A single client is shared by all searches so concurrent queries reuse
+    one pooled connection instead of re-handshaking per call.
     """
-    endpoint = os.getenv("AZURE_AI_SEARCH_SERVICE_ENDPOINT_SCENARIO_1")
-    index_name = os.getenv("AZURE_SEARCH_INDEX_NAME_SCENARIO_1")
-    api_key = os.getenv("AZURE_AI_SEARCH_ADMIN_KEY_SCENARIO_1")
-    if not all([endpoint, index_name, api_key]):
+    if not all([_CFG.endpoint, _CFG.index, _CFG.key]):
         logger.error("One or more environment variables for Azure Search are missing.")
         raise ValueError("Missing environment variable for Azure Search.")
     logger.info(
-        f"Initializing SearchClient with endpoint: {endpoint}, index_name: {index_name}"
+        f"Initializing SearchClient with endpoint: {_CFG.endpoint}, index_name: {_CFG.index}"
     )
-    credential = AzureKeyCredential(api_key)
+    credential = AzureKeyCredential(_CFG.key)
     search_client = SearchClient(
-        endpoint=endpoint, index_name=index_name, credential=credential
+        endpoint=_CFG.endpoint, index_name=_CFG.index, credential=credential
     )
     logger.info("SearchClient initialized successfully.")
     return search_client
@@ -38,6 +57,48 @@ def init_search_client() -> SearchClient:
 search_client = init_search_client()
 
 
+# Both caption fields fetched in one precompiled C-level lookup instead of
+# two getattr calls per result.
+_caption_fields = operator.attrgetter("highlights", "text")
+
+
+def _extract_caption(captions: Any) -> str:
+    """
+    Pull the best caption text out of an @search.captions entry without
+    per-attribute hasattr probing.
+
+    :param captions: The @search.captions list from a search result, if any.
+    :return: The caption highlights or text, or a placeholder.
+    """
+    if not captions:
+        return "Caption not available"
+    try:
+        highlights, text = _caption_fields(captions[0])
+    except AttributeError:
+        return "Caption not available"
+    return highlights or text or "Caption not available"
+
+
+# The per-result block is fixed, so it is compiled once as a format_map
+# template: one C-level substitution pass per result instead of repeated
+# string concatenation.
+_TEMPLATE = (
+    "========================================\n"
+    "🆔 ID: {chunk_id}\n"
+    "📂 Source Doc Path: {parent_path}\n"
+    "📜 Content: {content}\n"
+    "💡 Caption: {caption}\n"
+    "========================================"
+)
+
+
+class _ResultView(dict):
+    """format_map view over a search result; absent keys render as N/A."""
+
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
+
 def _format_azure_search_results(
     results: List[Dict[str, Any]], truncate: int = 1000
 ) -> str:
@@ -55,38 +116,93 @@ def _format_azure_search_results(
     :param truncate: Maximum number of characters to include from the content.
     :return: A formatted string representation of the search results.
     """
-    formatted_results = []
+    parts = []
     for result in results:
-        chunk_id = result.get("chunk_id", "N/A")
-        reranker_score = result.get("@search.reranker_score", "N/A")
-        source_doc_path = result.get("parent_path", "N/A")
-        content = result.get("chunk", "N/A")
-        content = content[:truncate] + "..." if len(content) > truncate else content
-
-        # Handle captions if available
-        captions = result.get("@search.captions", [])
-        caption = "Caption not available"
-        if captions:
-            first_caption = captions[0]
-            # Check if the first caption has 'highlights' or 'text'
-            if hasattr(first_caption, "highlights") and first_caption.highlights:
-                caption = first_caption.highlights
-            elif hasattr(first_caption, "text") and first_caption.text:
-                caption = first_caption.text
-
-        result_string = (
-            "========================================\n"
-            f"🆔 ID: {chunk_id}\n"
-            f"📂 Source Doc Path: {source_doc_path}\n"
-            f"📜 Content: {content}\n"
-            f"💡 Caption: {caption}\n"
-            "========================================"
+        view = _ResultView(result)
+        content = view["chunk"]
+        if len(content) > truncate:
+            content = content[:truncate] + "..."
+        view["content"] = content
+        view["caption"] = _extract_caption(result.get("@search.captions"))
+        parts.append(_TEMPLATE.format_map(view))
+    return "\n\n".join(parts)
+
+
+# Per-mode keyword arguments for search_client.search; built once so the
+# single hot search path below just copies the right dict.
+_MODE_KWARGS = {
+    "keyword": {"query_type": QueryType.SIMPLE},
+    "semantic": {
+        "query_type": QueryType.SEMANTIC,
+        "semantic_configuration_name": "my-semantic-config",
+        "query_caption": QueryCaptionType.EXTRACTIVE,
+        "query_answer": QueryAnswerType.EXTRACTIVE,
+        "filter": "",
+    },
+    "hybrid": {"query_type": QueryType.SIMPLE},
+}
+
+# Modes that add a vector component to the query.
+_VECTOR_MODES = frozenset({"semantic", "hybrid"})
+
+# Only the fields the formatter renders: projecting server-side cuts the
+# per-document response bytes (captions arrive separately via @search.captions).
+_SELECT_FIELDS = ["chunk_id", "parent_path", "chunk"]
+
+
+async def _search_raw(mode: str, search_text: str, top: int) -> List[Dict[str, Any]]:
+    """
+    Executes a search in the given mode and returns the raw result documents.
+
+    Keeping this layer string-free means callers that post-process results
+    (dedup, reranking, batching) work on dicts, and formatting happens only
+    once at the outermost boundary.
+
+    :param mode: One of "keyword", "semantic", or "hybrid".
+    :param search_text: The text to search for.
+    :param top: The maximum number of results to return.
+    :return: The raw result documents, at most `top` of them.
+    """
+    kwargs = dict(_MODE_KWARGS[mode])
+    if mode in _VECTOR_MODES:
+        kwargs["vector_queries"] = [
+            VectorizableTextQuery(
+                text=search_text, k_nearest_neighbors=5, fields="vector", weight=0.5
+            )
+        ]
+    results = await search_client.search(
+        search_text=search_text, top=top, select=_SELECT_FIELDS, **kwargs
+    )
+    # Materialize the paged iterator exactly once (a second pass would
+    # silently issue fresh page requests) and cap at `top` defensively.
+    return [doc async for doc in results][:top]
+
+
+async def _do_search(mode: str, search_text: str, top: int) -> str:
+    """
+    Executes a search in the given mode and formats the results.
+
+    :param mode: One of "keyword", "semantic", or "hybrid".
+    :param search_text: The text to search for.
+    :param top: The maximum number of results to return.
+    :return: A formatted string of search results.
+    """
+    logger.info("%s_search function called.", mode)
+    try:
+        formatted = _format_azure_search_results(
+            await _search_raw(mode, search_text, top)
         )
-        formatted_results.append(result_string)
-    return "\n\n".join(formatted_results)
+        # Full result dumps are many KB; only surface them at DEBUG and let
+        # %-formatting defer the work when the level filters the record.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted results: %s", formatted)
+        return formatted
+    except Exception as e:
+        logger.error("%s_search - Error during %s search: %s", mode, mode, e)
+        return f"Error during {mode} search."
 
 
-def keyword_search(
+async def keyword_search(
     search_text: str, top: int = 5
 ) -> Annotated[str, "A formatted string of search results for the keyword query"]:
     """
@@ -96,20 +212,10 @@ def keyword_search(
     :param top: The maximum number of results to return.
     :return: A formatted string of search results.
     """
-    logger.info("keyword_search function called.")
-    try:
-        results = search_client.search(
-            search_text=search_text, query_type=QueryType.SIMPLE, top=top
-        )
-        formatted = _format_azure_search_results(results)
-        logger.info(f"Extracted results: {formatted}")
-        return formatted
-    except Exception as e:
-        logger.error(f"keyword_search - Error during keyword search: {e}")
-        return "Error during keyword search."
+    return await _do_search("keyword", search_text, top)
 
 
-def semantic_search(
+async def semantic_search(
     search_text: str, top: int = 5
 ) -> Annotated[str, "A formatted string of search results for the semantic query"]:
     """
@@ -119,30 +225,10 @@ def semantic_search(
     :param top: The maximum number of results to return.
     :return: A formatted string of search results.
     """
-    logger.info("semantic_search function called.")
-    try:
-        vector_query = VectorizableTextQuery(
-            text=search_text, k_nearest_neighbors=5, fields="vector", weight=0.5
-        )
-        results = search_client.search(
-            search_text=search_text,
-            vector_queries=[vector_query],
-            query_type=QueryType.SEMANTIC,
-            semantic_configuration_name="my-semantic-config",
-            query_caption=QueryCaptionType.EXTRACTIVE,
-            query_answer=QueryAnswerType.EXTRACTIVE,
-            filter="",
-            top=top,
-        )
-        formatted = _format_azure_search_results(results)
-        logger.info(f"Extracted results: {formatted}")
-        return formatted
-    except Exception as e:
-        logger.error(f"semantic_search - Error during semantic search: {e}")
-        return "Error during semantic search."
+    return await _do_search("semantic", search_text, top)
 
 
-def hybrid_search(
+async def hybrid_search(
     search_text: str, top: int = 5
 ) -> Annotated[str, "A formatted string of search results for the hybrid query"]:
     """
@@ -152,20 +238,30 @@ def hybrid_search(
     :param top: The maximum number of results to return.
     :return: A formatted string of search results.
     """
-    logger.info("hybrid_search function called.")
-    try:
-        vector_query = VectorizableTextQuery(
-            text=search_text, k_nearest_neighbors=5, fields="vector", weight=0.5
-        )
-        results = search_client.search(
-            search_text=search_text,
-            vector_queries=[vector_query],
-            query_type=QueryType.SIMPLE,
-            top=top,
-        )
-        formatted = _format_azure_search_results(results)
-        logger.info(f"Extracted results: {formatted}")
-        return formatted
-    except Exception as e:
-        logger.error(f"hybrid_search - Error during hybrid search: {e}")
-        return "Error during hybrid search."
+    return await _do_search("hybrid", search_text, top)
+
+
+# Search functions by mode, for batch dispatch.
+_SEARCH_MODES = {
+    "keyword": keyword_search,
+    "semantic": semantic_search,
+    "hybrid": hybrid_search,
+}
+
+
+async def batch_search(
+    queries: List[str], mode: str = "semantic", top: int = 5
+) -> Annotated[List[str], "Formatted result strings, one per query"]:
+    """
+    Executes several search queries concurrently, overlapping their network
+    round-trips instead of serializing them.
+
+    :param queries: The list of query strings to run.
+    :param mode: Which search to use: "keyword", "semantic", or "hybrid".
+    :param top: The maximum number of results to return per query.
+    :return: Formatted result strings in the same order as `queries`.
+    """
+    search_fn = _SEARCH_MODES.get(mode)
+    if search_fn is None:
+        raise ValueError(f"Unknown search mode: {mode!r}")
+    return list(await asyncio.gather(*(search_fn(q, top=top) for q in queries)))
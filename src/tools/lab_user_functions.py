@@ -2,30 +2,39 @@ import datetime
 import json
 from typing import Any, Dict, List
 
+# These tool replies are tiny fixed-shape JSON objects, so the strings are
+# prebuilt (or assembled with one f-string) instead of running json.dumps
+# per invocation.
+_MOCK_WEATHER_JSON = {
+    location: f'{{"weather_info": "{report}"}}'
+    for location, report in {
+        "Seattle": "Rainy, 15°C",
+        "Tokyo": "Cloudy, 22°C",
+        "Sydney": "Sunny, 30°C",
+    }.items()
+}
+_DEFAULT_WEATHER_JSON = '{"weather_info": "No data for this location"}'
+_EMAIL_DISPATCHED_JSON = '{"status": "Email dispatched"}'
+
 
 def get_local_time(format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """Return current local time in a specified format as JSON."""
     now = datetime.datetime.now()
+    # format_str is caller-controlled, so the value must be escaped properly.
     return json.dumps({"local_time": now.strftime(format_str)})
 
 
 def get_mock_weather(location: str) -> str:
     """Return a mock weather report for the given location."""
-    mock_data = {
-        "Seattle": "Rainy, 15°C",
-        "Tokyo": "Cloudy, 22°C",
-        "Sydney": "Sunny, 30°C",
-    }
-    report = mock_data.get(location, "No data for this location")
-    return json.dumps({"weather_info": report})
+    return _MOCK_WEATHER_JSON.get(location, _DEFAULT_WEATHER_JSON)
 
 
 def add_numbers(a: int, b: int) -> str:
     """Return sum of two numbers as JSON."""
-    return json.dumps({"sum": a + b})
+    return f'{{"sum": {a + b}}}'
 
 
 def dispatch_email(to: str, subject: str, body: str) -> str:
     """Mock sending an email."""
     print(f"Sending email to {to} with subject: {subject}\nBody:\n{body}")
-    return json.dumps({"status": "Email dispatched"})
+    return _EMAIL_DISPATCHED_JSON
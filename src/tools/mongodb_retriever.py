@@ -1,9 +1,13 @@
+import asyncio
 import logging
 import os
+import threading
 import urllib.parse
-from typing import List
+from functools import cache, lru_cache
+from typing import List, Tuple
 
 import pymongo
+from motor.motor_asyncio import AsyncIOMotorClient
 
 from src.aoai.azure_openai import AzureOpenAIManager
 
@@ -11,6 +15,7 @@ from src.aoai.azure_openai import AzureOpenAIManager
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
+logger = logging.getLogger(__name__)
 
 # Retrieve environment variables for MongoDB connection
 COSMOS_MONGO_USER = os.environ.get("COSMOS_MONGO_USER")
@@ -21,15 +26,35 @@ COSMOS_MONGO_SERVER = os.environ.get("COSMOS_MONGO_SERVER")
 DEFAULT_DATABASE = os.environ.get("COSMOS_MONGO_DATABASE", "ExampleDB")
 DEFAULT_COLLECTION = os.environ.get("COSMOS_MONGO_COLLECTION", "ExampleCollection")
 
-# Construct the MongoDB connection string
-mongo_conn = (
-    "mongodb+srv://"
-    + urllib.parse.quote(COSMOS_MONGO_USER)
-    + ":"
-    + urllib.parse.quote(COSMOS_MONGO_PWD)
-    + "@"
-    + COSMOS_MONGO_SERVER
-    + "?tls=true&authMechanism=SCRAM-SHA-256&retrywrites=false&maxIdleTimeMS=120000"
+
+@cache
+def _build_conn_str() -> str:
+    """
+    Build the MongoDB connection string exactly once: credentials are quoted
+    a single time and the finished string reused for every connection.
+    """
+    return (
+        "mongodb+srv://"
+        + urllib.parse.quote_plus(COSMOS_MONGO_USER)
+        + ":"
+        + urllib.parse.quote_plus(COSMOS_MONGO_PWD)
+        + "@"
+        + COSMOS_MONGO_SERVER
+        + "?tls=true&authMechanism=SCRAM-SHA-256&retrywrites=false&maxIdleTimeMS=120000"
+    )
+
+
+mongo_conn = _build_conn_str()
+
+# Shared client tuning: fail fast on an unreachable server, bound slow reads,
+# retry transient read errors, and allow a deeper pool under concurrency.
+_CLIENT_KWARGS = dict(
+    compressors="zstd,snappy",
+    serverSelectionTimeoutMS=3000,
+    socketTimeoutMS=10000,
+    retryReads=True,
+    maxPoolSize=100,
+    minPoolSize=5,
 )
 
 # Initialize Azure OpenAI Manager
@@ -56,17 +81,117 @@ def generate_embeddings(text: str) -> List[float]:
         embedding_response = aoai_helper.generate_embedding(text)
         return embedding_response.data[0].embedding
     except Exception as e:
-        logging.error(f"Error generating embedding for text: {text}. Error: {e}")
+        logger.error("Error generating embedding for text: %s. Error: %s", text, e)
         return []
 
 
-# Establish connection and select database
-try:
-    mongo_client = pymongo.MongoClient(mongo_conn)
-    db = mongo_client[DEFAULT_DATABASE]
-    print("✅ Connected to MongoDB.")
-except pymongo.errors.ConnectionError as e:
-    print(f"❌ MongoDB connection error: {e}")
+# The sync client is created lazily on first use instead of at import, so
+# importing this module stays cheap and workers that never touch MongoDB
+# never open a connection. Double-checked locking keeps creation thread-safe.
+_db = None
+_collection = None
+_db_lock = threading.Lock()
+
+
+def _get_db():
+    """Return the default database handle, creating the client on first use."""
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                _db = pymongo.MongoClient(mongo_conn, **_CLIENT_KWARGS)[
+                    DEFAULT_DATABASE
+                ]
+                logger.info("✅ Connected to MongoDB.")
+    return _db
+
+
+def _get_collection():
+    """Return the cached default collection handle, resolving it lazily."""
+    global _collection
+    if _collection is None:
+        _collection = _get_db()[DEFAULT_COLLECTION]
+    return _collection
+
+
+def _reset_mongo_client() -> None:
+    """Drop cached handles so forked workers build their own client."""
+    global _db, _collection
+    _db = None
+    _collection = None
+
+
+# pymongo clients must not be shared across fork(); null the cached handles
+# in children so the next access reconnects.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_mongo_client)
+
+# Async client for vector search: Motor connects lazily, so constructing it at
+# import costs nothing, and concurrent RAG queries overlap their network I/O.
+async_mongo_client = AsyncIOMotorClient(mongo_conn, **_CLIENT_KWARGS)
+ASYNC_COLLECTION = async_mongo_client[DEFAULT_DATABASE][DEFAULT_COLLECTION]
+
+
+def generate_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """
+    Generates embedding vectors for several texts in one request. The Azure
+    OpenAI embeddings endpoint accepts a list, so the HTTPS round-trip and
+    response parse are amortized across all inputs.
+
+    Args:
+        texts (List[str]): The texts to be converted into embeddings.
+
+    Returns:
+        List[List[float]]: One embedding per input text, in order ([] per
+        text on failure).
+    """
+    try:
+        response = aoai_helper.get_azure_openai_client().embeddings.create(
+            input=texts, model=aoai_helper.embedding_model_name
+        )
+        return [item.embedding for item in response.data]
+    except Exception as e:
+        logger.error("Error generating batch embeddings. Error: %s", e)
+        return [[] for _ in texts]
+
+
+@lru_cache(maxsize=2048)
+def _embed_query(query: str) -> Tuple[float, ...]:
+    """
+    Memoize query embeddings so repeated identical queries skip the Azure
+    OpenAI round-trip. Returned as a tuple to keep cache entries immutable.
+    Raises on an empty embedding so transient failures are never memoized.
+
+    Args:
+        query (str): The query text to embed.
+
+    Returns:
+        Tuple[float, ...]: The embedding vector.
+
+    Raises:
+        RuntimeError: If no embedding could be generated.
+    """
+    embedding = generate_embeddings(query)
+    if not embedding:
+        raise RuntimeError("Embedding generation returned no data.")
+    return tuple(embedding)
+
+
+def _cached_query_embedding(query: str) -> Tuple[float, ...]:
+    """
+    Fetch the (cached) embedding for a query, retrying on the next call after
+    a failure instead of pinning the empty result in the cache.
+
+    Args:
+        query (str): The query text to embed.
+
+    Returns:
+        Tuple[float, ...]: The embedding vector, empty on failure.
+    """
+    try:
+        return _embed_query(query)
+    except RuntimeError:
+        return ()
 
 
 def retrieve_document(query: dict) -> dict:
@@ -80,11 +205,10 @@ def retrieve_document(query: dict) -> dict:
         dict: The first document matching the query or None if no document is found.
     """
     try:
-        collection = db[DEFAULT_COLLECTION]
-        document = collection.find_one(query)
+        document = _get_collection().find_one(query)
         return document
     except Exception as e:
-        print(f"Error retrieving document: {e}")
+        logger.error("Error retrieving document: %s", e, exc_info=True)
         return None
 
 
@@ -103,15 +227,14 @@ def upsert_document(query: dict, document: dict) -> dict:
         dict: A summary of the upsert operation including matched count, modified count, and upserted ID.
     """
     try:
-        collection = db[DEFAULT_COLLECTION]
-        result = collection.replace_one(query, document, upsert=True)
+        result = _get_collection().replace_one(query, document, upsert=True)
         return {
             "matched_count": result.matched_count,
             "modified_count": result.modified_count,
             "upserted_id": result.upserted_id,
         }
     except Exception as e:
-        print(f"Error during upsert: {e}")
+        logger.error("Error during upsert: %s", e, exc_info=True)
         return {}
 
 
@@ -127,11 +250,10 @@ def update_document(query: dict, update: dict) -> int:
         int: The number of documents modified (0 or 1).
     """
     try:
-        collection = db[DEFAULT_COLLECTION]
-        result = collection.update_one(query, update)
+        result = _get_collection().update_one(query, update)
         return result.modified_count
     except Exception as e:
-        print(f"Error updating document: {e}")
+        logger.error("Error updating document: %s", e, exc_info=True)
         return 0
 
 
@@ -146,11 +268,10 @@ def delete_document(query: dict) -> int:
         int: The number of documents deleted (0 or 1).
     """
     try:
-        collection = db[DEFAULT_COLLECTION]
-        result = collection.delete_one(query)
+        result = _get_collection().delete_one(query)
         return result.deleted_count
     except Exception as e:
-        print(f"Error deleting document: {e}")
+        logger.error("Error deleting document: %s", e, exc_info=True)
         return 0
 
 
@@ -165,15 +286,14 @@ def query_documents(query: dict) -> list:
         list: A list of documents matching the query.
     """
     try:
-        collection = db[DEFAULT_COLLECTION]
-        documents = list(collection.find(query))
+        documents = list(_get_collection().find(query))
         return documents
     except Exception as e:
-        print(f"Error querying documents: {e}")
+        logger.error("Error querying documents: %s", e, exc_info=True)
         return []
 
 
-def vector_search(query: str):
+async def vector_search(query: str):
     """
     Searches for semantically similar documents in CosmosDB using vector search.
 
@@ -187,17 +307,23 @@ def vector_search(query: str):
     """
     SIMILARITY_THRESHOLD = 0.96
 
-    # Generate the embeddings for the query text
-    embedding_response = generate_embeddings(query)
+    # Generate (or reuse) the embeddings for the query text. The cached
+    # helper makes a synchronous HTTPS call on a miss, so it runs in a worker
+    # thread to keep the event loop free for concurrent searches.
+    embedding_response = list(await asyncio.to_thread(_cached_query_embedding, query))
+    if not embedding_response:
+        logger.warning("⚠️ No embedding available for query; skipping vector search.")
+        return None
 
-    # Define search pipeline with required fields
+    # Define search pipeline with required fields; the server returns only the
+    # single best candidate instead of five for Python-side max().
     search_stage = {
         "$vectorSearch": {
             "index": "VectorSearchIndex",  # Ensure this matches the actual index name
             "path": "queryVector",  # Must match the field storing embeddings
             "queryVector": embedding_response,
-            "numCandidates": 5,
-            "limit": 5,
+            "numCandidates": 20,
+            "limit": 1,
         }
     }
 
@@ -208,19 +334,56 @@ def vector_search(query: str):
 
     # Assemble and execute the pipeline
     pipeline = [search_stage, project_stage]
-    collection = db[DEFAULT_COLLECTION]
 
     try:
-        results = list(collection.aggregate(pipeline))
+        results = await ASYNC_COLLECTION.aggregate(pipeline).to_list(1)
     except Exception as e:
-        print(f"❌ MongoDB vector search failed: {e}")
+        logger.error("❌ MongoDB vector search failed: %s", e)
         return None
 
     if not results:
-        print("⚠️ No matching vector results found in CosmosDB.")
+        logger.info("⚠️ No matching vector results found in CosmosDB.")
         return None
 
-    # Retrieve the best result by similarity score
-    best_result = max(results, key=lambda x: x.get("similarityScore", 0), default=None)
+    return results[0]["response"]
+
 
-    return best_result["response"]
+async def vector_search_batch(queries: List[str]) -> list:
+    """
+    Runs vector search for several queries at once: all embeddings come from
+    a single Azure OpenAI request and the per-query aggregations execute
+    concurrently through the async client.
+
+    Args:
+        queries (List[str]): The query texts.
+
+    Returns:
+        list: One response (or None) per query, in input order.
+    """
+    # The batch embeddings request is a synchronous HTTPS call; run it in a
+    # worker thread so concurrent callers are not serialized behind it.
+    embeddings = await asyncio.to_thread(generate_embeddings_batch, queries)
+
+    async def _one(embedding: List[float]):
+        if not embedding:
+            return None
+        pipeline = [
+            {
+                "$vectorSearch": {
+                    "index": "VectorSearchIndex",
+                    "path": "queryVector",
+                    "queryVector": embedding,
+                    "numCandidates": 20,
+                    "limit": 1,
+                }
+            },
+            {"$project": {"similarityScore": {"$meta": "searchScore"}, "response": 1}},
+        ]
+        try:
+            results = await ASYNC_COLLECTION.aggregate(pipeline).to_list(1)
+        except Exception as e:
+            logger.error("❌ MongoDB vector search failed: %s", e)
+            return None
+        return results[0]["response"] if results else None
+
+    return list(await asyncio.gather(*(_one(embedding) for embedding in embeddings)))